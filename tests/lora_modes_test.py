@@ -13,6 +13,76 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from ykgen.agents import VideoAgent
 
+# Example scenes for the LLM selection test, built once at import
+TEST_SCENES = (
+    {
+        "location": "Futuristic cyberpunk city",
+        "time": "Night",
+        "action": "Neon lights reflecting on wet streets",
+        "characters": [{"name": "Cyberpunk Warrior", "description": "A tech-enhanced warrior"}],
+        "image_prompt_positive": "cyberpunk city, neon lights, futuristic, dark atmosphere",
+        "image_prompt_negative": "bright daylight, nature, medieval"
+    },
+    {
+        "location": "Peaceful watercolor garden",
+        "time": "Morning",
+        "action": "Soft morning light filtering through flowers",
+        "characters": [{"name": "Garden Sprite", "description": "A magical garden fairy"}],
+        "image_prompt_positive": "watercolor garden, soft colors, peaceful, morning light",
+        "image_prompt_negative": "harsh lighting, industrial, dark"
+    },
+    {
+        "location": "Retro gaming arcade",
+        "time": "Evening",
+        "action": "Classic arcade games glowing in the dark",
+        "characters": [{"name": "Pixel Hero", "description": "A retro game character"}],
+        "image_prompt_positive": "retro arcade, pixel art, nostalgic, glowing screens",
+        "image_prompt_negative": "modern graphics, realistic, photographic"
+    },
+)
+
+# Group mode configuration for the LLM selection test
+GROUP_CONFIG = {
+    "mode": "group",
+    "model_type": "flux-schnell",
+    "required_loras": [
+        {
+            "name": "Illustrious XL Schnell",
+            "file": "flux_illustriousXL_schnell_v1-rev2.safetensors",
+            "description": "Anime illustration style",
+            "trigger": "illustrious style",
+            "strength_model": 1.0,
+            "strength_clip": 1.0
+        }
+    ],
+    "optional_loras": [
+        {
+            "name": "Pixel Art Flux",
+            "file": "pixel-art-flux-v3-learning-rate-4.safetensors",
+            "description": "Modern pixel art style, perfect for retro gaming scenes",
+            "trigger": "pixel art",
+            "strength_model": 0.8,
+            "strength_clip": 0.8
+        },
+        {
+            "name": "Watercolor Schnell",
+            "file": "watercolor_schnell_v1.safetensors",
+            "description": "Watercolor painting style, ideal for peaceful natural scenes",
+            "trigger": "watercolor painting",
+            "strength_model": 0.7,
+            "strength_clip": 0.7
+        },
+        {
+            "name": "PVC Figure",
+            "file": "pvc-shnell-7250+7500.safetensors",
+            "description": "Collectible figure style, good for character focus",
+            "trigger": "pvc figure, figma",
+            "strength_model": 0.6,
+            "strength_clip": 0.6
+        }
+    ]
+}
+
 
 def test_all_mode():
     """Test the traditional 'all' mode where all selected LoRAs are used for every image."""
@@ -152,87 +222,17 @@ def test_llm_lora_selection():
     print("Testing LLM-based LoRA Selection")
     print("=" * 80)
     
-    # Example scenes for testing
-    test_scenes = [
-        {
-            "location": "Futuristic cyberpunk city",
-            "time": "Night",
-            "action": "Neon lights reflecting on wet streets",
-            "characters": [{"name": "Cyberpunk Warrior", "description": "A tech-enhanced warrior"}],
-            "image_prompt_positive": "cyberpunk city, neon lights, futuristic, dark atmosphere",
-            "image_prompt_negative": "bright daylight, nature, medieval"
-        },
-        {
-            "location": "Peaceful watercolor garden",
-            "time": "Morning",
-            "action": "Soft morning light filtering through flowers",
-            "characters": [{"name": "Garden Sprite", "description": "A magical garden fairy"}],
-            "image_prompt_positive": "watercolor garden, soft colors, peaceful, morning light",
-            "image_prompt_negative": "harsh lighting, industrial, dark"
-        },
-        {
-            "location": "Retro gaming arcade",
-            "time": "Evening",
-            "action": "Classic arcade games glowing in the dark",
-            "characters": [{"name": "Pixel Hero", "description": "A retro game character"}],
-            "image_prompt_positive": "retro arcade, pixel art, nostalgic, glowing screens",
-            "image_prompt_negative": "modern graphics, realistic, photographic"
-        }
-    ]
-    
-    # Group mode configuration for testing
-    group_config = {
-        "mode": "group",
-        "model_type": "flux-schnell",
-        "required_loras": [
-            {
-                "name": "Illustrious XL Schnell",
-                "file": "flux_illustriousXL_schnell_v1-rev2.safetensors",
-                "description": "Anime illustration style",
-                "trigger": "illustrious style",
-                "strength_model": 1.0,
-                "strength_clip": 1.0
-            }
-        ],
-        "optional_loras": [
-            {
-                "name": "Pixel Art Flux",
-                "file": "pixel-art-flux-v3-learning-rate-4.safetensors",
-                "description": "Modern pixel art style, perfect for retro gaming scenes",
-                "trigger": "pixel art",
-                "strength_model": 0.8,
-                "strength_clip": 0.8
-            },
-            {
-                "name": "Watercolor Schnell",
-                "file": "watercolor_schnell_v1.safetensors",
-                "description": "Watercolor painting style, ideal for peaceful natural scenes",
-                "trigger": "watercolor painting",
-                "strength_model": 0.7,
-                "strength_clip": 0.7
-            },
-            {
-                "name": "PVC Figure",
-                "file": "pvc-shnell-7250+7500.safetensors",
-                "description": "Collectible figure style, good for character focus",
-                "trigger": "pvc figure, figma",
-                "strength_model": 0.6,
-                "strength_clip": 0.6
-            }
-        ]
-    }
-    
     print("Test Scenes:")
-    for i, scene in enumerate(test_scenes, 1):
+    for i, scene in enumerate(TEST_SCENES, 1):
         print(f"{i}. {scene['location']} - {scene['action']}")
     print()
     
     print("Available LoRA Options:")
     print("Required:")
-    for lora in group_config['required_loras']:
+    for lora in GROUP_CONFIG['required_loras']:
         print(f"  - {lora['name']}: {lora['description']}")
     print("Optional:")
-    for lora in group_config['optional_loras']:
+    for lora in GROUP_CONFIG['optional_loras']:
         print(f"  - {lora['name']}: {lora['description']}")
     print()
     
@@ -244,7 +244,7 @@ def test_llm_lora_selection():
     
     # Note: Actual LLM selection would require running the full pipeline
     print("✅ LLM selection test setup complete!")
-    print("To test actual LLM selection, run: select_loras_for_scenes(test_scenes, group_config)")
+    print("To test actual LLM selection, run: select_loras_for_scenes(list(TEST_SCENES), GROUP_CONFIG)")
     print()
 
 
@@ -13,7 +13,10 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ykgen import VideoGenerationClient
+from ykgen import VideoGenerationClient, VideoGenerationTask
+
+# Seconds the async test waits for videos; set to 0 for a quick smoke run
+WAIT_SECONDS = float(os.environ.get("YKGEN_TEST_WAIT_SECONDS", "30"))
 
 
 def test_video_generation():
@@ -124,20 +127,26 @@ def test_async_generation():
         prompt = f"Dynamic scene {i+1} with smooth motion and cinematic effects"
         output_dir = str(Path(img_path).parent)
         
-        thread = client.generate_video_async(
+        thread = VideoGenerationTask(
+            client,
             image_path=img_path,
             prompt=prompt,
             output_dir=output_dir,
-            scene_name=f"async_test_{i+1:02d}"
+            scene_name=f"async_test_{i+1:02d}",
+            api_key=api_key
         )
+        thread.start()
         threads.append(thread)
         print(f"  Started thread for image {i+1}")
     
     print(f"\n⏳ {len(threads)} video generation threads running...")
     print("Videos will be saved as they complete")
-    print("Waiting 30 seconds for progress updates...")
+    print(f"Waiting up to {WAIT_SECONDS:g} seconds for progress updates...")
     
-    time.sleep(30)
+    # Return as soon as every thread is done instead of always waiting
+    deadline = time.monotonic() + WAIT_SECONDS
+    for thread in threads:
+        thread.join(timeout=max(0.0, deadline - time.monotonic()))
     
     # Check thread status
     alive_count = sum(1 for t in threads if t.is_alive())
@@ -24,10 +24,12 @@ from ykgen.config.constants import (
 )
 from .utils import (
     retry_with_backoff,
+    retry_with_backoff_async,
     validate_file_exists,
     validate_directory_exists,
     generate_output_directory,
     calculate_file_size_mb,
+    file_size_mb,
     format_duration,
 )
 from ykgen.config.exceptions import (
@@ -54,6 +56,7 @@ from .video import (
     combine_videos,
     combine_videos_with_transitions,
     combine_scene_videos,
+    combine_scene_videos_with_audio,
     VideoTaskMonitor,
     VideoResultProcessor,
     VideoQualityManager,
@@ -112,6 +115,7 @@ __all__ = [
     "combine_videos",
     "combine_videos_with_transitions",
     "combine_scene_videos",
+    "combine_scene_videos_with_audio",
     # Video management
     "VideoTaskMonitor",
     "VideoResultProcessor", 
@@ -145,10 +149,12 @@ __all__ = [
     "step_progress",
     # Utilities
     "retry_with_backoff",
+    "retry_with_backoff_async",
     "validate_file_exists",
     "validate_directory_exists",
     "generate_output_directory",
     "calculate_file_size_mb",
+    "file_size_mb",
     "format_duration",
     # Exceptions
     "YKGenError",
@@ -214,7 +214,7 @@ Scenes to process: {len(scenes)} scenes
 Additional Requirements:
 - Preserve exact character descriptions from provided data in all prompts.
 
-""" + "\n".join([f"Scene {i+1}:\n- Location: {scene.get('location', 'Unknown location')}\n- Time: {scene.get('time', 'Unknown time')}\n- Action: {scene.get('action', 'Unknown action')}\n- Characters: {', '.join([c.get('name', 'Unknown') for c in scene.get('characters', [])])}" for i, scene in enumerate(scenes)]) + f"""
+""" + "\n".join([f"Scene {i+1}:\n- Location: {scene.get('location', 'Unknown location')}\n- Time: {scene.get('time', 'Unknown time')}\n- Action: {scene.get('action', 'Unknown action')}\n- Characters: {', '.join(c.get('name', 'Unknown') for c in scene.get('characters', []))}" for i, scene in enumerate(scenes)]) + f"""
 
 Generate prompts maintaining character and environment consistency across all scenes."""
 
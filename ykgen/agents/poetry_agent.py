@@ -823,7 +823,7 @@ between scenes in terms of characters and the poetic environment described."""
                     f.write(f"Location: {scene.get('location', 'Unknown location')}\n")
                     f.write(f"Time: {scene.get('time', 'Unknown time')}\n")
                     f.write(f"Action: {scene.get('action', 'Unknown action')}\n")
-                    f.write(f"Characters: {', '.join([c.get('name', 'Unknown') for c in scene.get('characters', [])])}\n\n")
+                    f.write(f"Characters: {', '.join(c.get('name', 'Unknown') for c in scene.get('characters', []))}\n\n")
                     
                     # Generated images for this scene
                     f.write(f"GENERATED IMAGES FOR SCENE {i}:\n")
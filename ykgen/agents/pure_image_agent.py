@@ -7,6 +7,7 @@ per scene and saves video prompts to a text file.
 """
 
 import os
+import re
 import time
 from typing import Optional, List, Dict, Any
 
@@ -26,6 +27,24 @@ from ..console import (
 from ykgen.model.models import Characters, SceneList, VisionState
 from ..providers import get_llm
 
+# Keywords for the fallback visual feature extraction, in priority order.
+# One case-insensitive scan finds every feature a sentence mentions; the
+# lookahead tries every position so overlapping keywords are all found.
+_FEATURE_KEYWORDS = (
+    ("hair", ('hair', 'hairstyle', 'haircut', 'blonde', 'brunette', 'black hair', 'brown hair', 'red hair', 'silver hair', 'white hair')),
+    ("eyes", ('eyes', 'eye color', 'blue eyes', 'green eyes', 'brown eyes', 'hazel eyes', 'gray eyes', 'golden eyes')),
+    ("clothing", ('wearing', 'dressed', 'outfit', 'clothing', 'shirt', 'dress', 'jacket', 'coat', 'uniform')),
+)
+_FEATURE_KEYWORDS_RE = re.compile(
+    "(?="
+    + "|".join(
+        f"(?P<{feature}>{'|'.join(map(re.escape, keywords))})"
+        for feature, keywords in _FEATURE_KEYWORDS
+    )
+    + ")",
+    re.IGNORECASE,
+)
+
 
 class PureImageAgent(BaseAgent):
     """Agent for pure image generation workflows - generates images only, no videos."""
@@ -480,22 +499,16 @@ Only extract features that are explicitly mentioned. If a feature is not describ
                 'distinctive_features': ''
             }
             
-            description_lower = description.lower()
             sentences = description.split('.')
             
-            # Basic keyword matching as fallback
-            hair_keywords = ['hair', 'hairstyle', 'haircut', 'blonde', 'brunette', 'black hair', 'brown hair', 'red hair', 'silver hair', 'white hair']
-            eye_keywords = ['eyes', 'eye color', 'blue eyes', 'green eyes', 'brown eyes', 'hazel eyes', 'gray eyes', 'golden eyes']
-            clothing_keywords = ['wearing', 'dressed', 'outfit', 'clothing', 'shirt', 'dress', 'jacket', 'coat', 'uniform']
-            
+            # Basic keyword matching as fallback: each sentence fills the
+            # first still-empty feature it mentions
             for sentence in sentences:
-                sentence_lower = sentence.lower()
-                if any(keyword in sentence_lower for keyword in hair_keywords) and not features['hair']:
-                    features['hair'] = sentence.strip()
-                elif any(keyword in sentence_lower for keyword in eye_keywords) and not features['eyes']:
-                    features['eyes'] = sentence.strip()
-                elif any(keyword in sentence_lower for keyword in clothing_keywords) and not features['clothing']:
-                    features['clothing'] = sentence.strip()
+                found = {match.lastgroup for match in _FEATURE_KEYWORDS_RE.finditer(sentence)}
+                for feature, _ in _FEATURE_KEYWORDS:
+                    if feature in found and not features[feature]:
+                        features[feature] = sentence.strip()
+                        break
             
             return features
         
@@ -964,7 +977,7 @@ Only extract features that are explicitly mentioned. If a feature is not describ
                     f.write(f"Location: {scene.get('location', 'Unknown location')}\n")
                     f.write(f"Time: {scene.get('time', 'Unknown time')}\n")
                     f.write(f"Action: {scene.get('action', 'Unknown action')}\n")
-                    f.write(f"Characters: {', '.join([c.get('name', 'Unknown') for c in scene.get('characters', [])])}\n\n")
+                    f.write(f"Characters: {', '.join(c.get('name', 'Unknown') for c in scene.get('characters', []))}\n\n")
                     
                     # Generated images for this scene
                     f.write(f"GENERATED IMAGES FOR SCENE {i}:\n")
@@ -639,7 +639,10 @@ def generate_story_record(
             record_content.append(
                 f"├── scene_{i+1:03d}_enhanced.mp4    (scene {i+1} with audio)"
             )
-        record_content.append("├── combined_story.mp4           (combined video)")
+        # The soundtrack is muxed while combining, so only one of these exists
+        record_content.append(
+            "├── combined_story.mp4           (combined video, if no soundtrack was added)"
+        )
         record_content.append(
             "└── combined_story_with_audio.mp4 (final video with soundtrack)"
         )
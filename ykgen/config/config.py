@@ -145,6 +145,36 @@ class Config:
     def LLM_MODEL(self) -> str:
         """Get the LLM model name."""
         return self._get_env("LLM_MODEL", "deepseek-ai/DeepSeek-V3")
+
+    @cached_property
+    def LLM_TIMEOUT_SECONDS(self) -> float:
+        """Get the per-request LLM timeout in seconds."""
+        return float(self._get_env("LLM_TIMEOUT_SECONDS", str(GenerationLimits.LLM_TIMEOUT_SECONDS)))
+
+    @cached_property
+    def USE_LLM_SELECTOR_ALWAYS(self) -> bool:
+        """Whether LoRA selection should always use the LLM (no keyword shortcut)."""
+        return str(self._get_env("USE_LLM_SELECTOR_ALWAYS", "false")).lower() == "true"
+
+    @cached_property
+    def LORA_SELECTION_REASONING(self) -> bool:
+        """Whether the LLM should explain its LoRA selection (costs extra output tokens)."""
+        return str(self._get_env("LORA_SELECTION_REASONING", "false")).lower() == "true"
+
+    @cached_property
+    def STRUCTURED_OUTPUT_METHOD(self) -> str:
+        """Get the structured output method (json_schema or function_calling)."""
+        return self._get_env("STRUCTURED_OUTPUT_METHOD", "json_schema").lower()
+
+    @cached_property
+    def PARSING_MODE(self) -> str:
+        """Get the structured output parsing mode (single or two_stage)."""
+        return self._get_env("PARSING_MODE", "single").lower()
+
+    @cached_property
+    def LLM_PARSER_MODEL(self) -> str:
+        """Get the model used to parse free-form output in two-stage mode."""
+        return self._get_env("LLM_PARSER_MODEL", self.LLM_MODEL)
         
     @cached_property
     def SILICONFLOW_VIDEO_KEY(self) -> str:
@@ -202,6 +232,11 @@ class Config:
         """Get the video generation timeout in minutes."""
         return int(self._get_env("VIDEO_TIMEOUT_MINUTES", str(VideoDefaults.TIMEOUT_MINUTES)))
         
+    @cached_property
+    def VIDEO_MAX_WORKERS(self) -> int:
+        """Get the maximum number of concurrent video generation tasks."""
+        return int(self._get_env("VIDEO_MAX_WORKERS", str(VideoDefaults.MAX_CONCURRENT_VIDEOS)))
+        
     @cached_property
     def AUDIO_DURATION_PER_SCENE(self) -> int:
         """Get the audio duration per scene."""
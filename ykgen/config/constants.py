@@ -16,20 +16,48 @@ class VideoDefaults:
     # Timing and timeouts
     MAX_WAIT_TIME_SECONDS = 600  # 10 minutes
     CHECK_INTERVAL_SECONDS = 5
+    FAST_POLL_COUNT = 3  # First status polls use the fast interval
+    FAST_POLL_INTERVAL_SECONDS = 2
+    POLL_BACKOFF_FACTOR = 1.5
+    POLL_MAX_INTERVAL_SECONDS = 30
+    POLL_JITTER_FRACTION = 0.25  # Up to this fraction of the interval is added at random
+    STATUS_HEDGE_AFTER_SECONDS = 2.0  # Send a duplicate status request if none returned by then
+    STATUS_HEDGE_MAX_WORKERS = 16  # Threads shared by hedged status requests of all clients
+    POLL_LOG_EVERY_N = 3  # Log unchanged in-progress statuses only every Nth poll
     TIMEOUT_MINUTES = 50
+    ASSUMED_CLIP_DURATION_SECONDS = 5.0  # Used when a clip's duration cannot be probed
     
     # Quality settings
     CRF_VALUE = 23  # Constant Rate Factor for video quality
+    USE_HARDWARE_ENCODER = True  # Re-encode with NVENC/QSV when available, else libx264
     AUDIO_BITRATE = "192k"
+    AUDIO_SAMPLE_RATE = 48000  # Clips re-encoded for a stream-copy join share these audio settings
+    AUDIO_CHANNELS = 2
     
     # Threading
     THREAD_CHECK_INTERVAL = 5
+    MAX_CONCURRENT_VIDEOS = 8  # Worker threads for video generation tasks
     PROGRESS_UPDATE_INTERVAL = 30
+    FFMPEG_THREADS_PER_JOB = 2  # Encoder threads per ffmpeg process when several run in parallel
+    FFMPEG_STDERR_TAIL_LINES = 50  # ffmpeg stderr lines kept for error messages
+    PROBE_CACHE_SIZE = 512  # Media probe results memoized per (path, mtime, size)
+    TRANSITION_PRESET = "veryfast"  # libx264 preset for the crossfade re-encode
+    TRANSITION_CRF = 22  # libx264 CRF for the crossfade re-encode
+    TRANSITION_FPS = 30  # Frame rate for crossfades when no clip has a constant rate
     
     # Retry settings
     MAX_RETRY_ATTEMPTS = 3
     RETRY_DELAY_SECONDS = 5
     RETRY_EXPONENTIAL_BACKOFF = True
+    
+    # Download settings
+    DOWNLOAD_CONNECT_TIMEOUT_SECONDS = 5
+    DOWNLOAD_READ_TIMEOUT_SECONDS = 60
+    DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+    # Upload settings
+    UPLOAD_MODE = "base64"  # "base64" (JSON data URI) or "multipart" (raw file upload)
+    MULTIPART_REJECTED_STATUS_CODES = (400, 415, 422)  # Fall back to base64 on these
 
 
 # ComfyUI Workflow Constants
@@ -127,7 +155,18 @@ class GenerationLimits:
     # Retry and timeout
     MAX_RETRIES = 3
     RETRY_DELAY_SECONDS = 2
-    LLM_RETRY_DELAY_SECONDS = 3
+    RETRY_MAX_DELAY_SECONDS = 30  # Cap for exponential backoff
+    RETRY_JITTER = 0.5  # Random +/- fraction applied to each backoff delay
+    LLM_RETRY_DELAY_SECONDS = 3  # Initial delay for exponential backoff
+    LLM_RETRY_MAX_DELAY_SECONDS = 30
+    LLM_MAX_ATTEMPTS = 3
+    MAX_CONCURRENT_LLM_CALLS = 8  # Worker threads for per-scene LLM calls
+    LLM_TIMEOUT_SECONDS = 120  # Per-request read timeout for LLM calls
+    LLM_CONNECT_TIMEOUT_SECONDS = 10
+    LLM_MAX_RETRIES = 0  # Retries done by the OpenAI client itself; callers retry with backoff
+    HEURISTIC_SELECTOR_MAX_LORAS = 5  # Catalogs up to this size may skip the LLM
+    LLM_MAX_CONNECTIONS = 32  # Shared LLM HTTP connection pool size
+    LLM_MAX_KEEPALIVE_CONNECTIONS = 16
     
     # Fallback limits
     MAX_FALLBACK_CHARACTERS = 2
@@ -147,6 +186,10 @@ class NetworkDefaults:
     # Request settings
     REQUEST_TIMEOUT = 300  # 5 minutes
     MAX_REQUEST_RETRIES = 3
+    
+    # HTTP connection pooling
+    POOL_CONNECTIONS = 16  # Number of hosts to keep connection pools for
+    POOL_MAXSIZE = 64  # Connections kept alive per host
 
 
 # ffmpeg Constants
@@ -50,6 +50,15 @@ class VideoAPIError(VideoGenerationError):
     pass
 
 
+class VideoStatusFailure(VideoAPIError):
+    """Raised when checking the status of a video request fails."""
+    
+    def __init__(self, reason: str, retryable: bool = False):
+        self.reason = reason
+        self.retryable = retryable
+        super().__init__(f"Video status check failed: {reason}")
+
+
 class VideoTimeoutError(VideoGenerationError):
     """Raised when video generation times out."""
     pass
@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Optional
 
 from rich import box
 from rich.align import Align
-from rich.console import Console
+from rich.console import Console, Group
 from rich.layout import Layout
 from rich.live import Live
 from rich.panel import Panel
@@ -191,6 +191,7 @@ class YKGenConsole:
 
         self.print_section_header("Scene Breakdown")
 
+        scene_panels = []
         for i, scene in enumerate(scenes, 1):
             scene_header = Text()
             scene_header.append(f"Scene {i:02d}", style="bold bright_cyan")
@@ -225,8 +226,10 @@ class YKGenConsole:
                 padding=(1, 2),
                 box=box.ROUNDED,
             )
-            self.console.print(scene_panel)
+            scene_panels.append(scene_panel)
 
+        # Render all panels in one print so the console writes them at once
+        self.console.print(Group(*scene_panels))
         self.console.print()
 
     def print_images_summary(self, image_paths: List[str]):
@@ -587,13 +590,13 @@ def print_generation_steps(agent_type: str, images_per_scene: int = 1):
     
     console.print_section_header("Generation Process")
     
+    # One Text for all steps, so the list is rendered and written in one print
+    steps_text = Text()
     for i, step in enumerate(steps, 1):
-        step_text = Text()
-        step_text.append(f"{i}. ", style="bold bright_cyan")
-        step_text.append(step, style="white")
-        console.console.print(step_text)
+        steps_text.append(f"{i}. ", style="bold bright_cyan")
+        steps_text.append(f"{step}\n", style="white")
     
-    console.console.print()
+    console.console.print(steps_text)
 
 def print_proxy_status():
     """Print proxy configuration status."""
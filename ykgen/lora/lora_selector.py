@@ -5,29 +5,433 @@ This module handles dynamic LoRA selection per image based on scene content
 and LoRA descriptions using LLM intelligence.
 """
 
-from typing import List, Dict, Any
-from langchain_core.prompts import ChatPromptTemplate
-from pydantic import BaseModel, Field
+import copy
+import functools
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, List, Dict, Any, Optional, Set, Tuple
 
 from ykgen.console import status_update, print_success, print_warning
+from ykgen.config.config import config
 from ykgen.providers import get_llm
 from ykgen.config.constants import GenerationLimits
-import time
 
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
 
-class LoRASelectionResult(BaseModel):
-    """Result of LLM-based LoRA selection."""
-    selected_loras: List[str] = Field(description="List of selected LoRA names")
-    reasoning: str = Field(description="Explanation of why these LoRAs were selected")
+# LangChain, pydantic, openai and tenacity are imported where they are used so
+# that importing this module (e.g. for CLI startup) stays cheap.
+
+# Reasoning recorded for LLM selections made without LORA_SELECTION_REASONING
+_LLM_SELECTION_NOTE = "Selected by the LLM (set LORA_SELECTION_REASONING=true for its reasoning)"
+
+
+@functools.lru_cache(maxsize=None)
+def _selection_schemas() -> Tuple[type, type]:
+    """
+    Build the structured output schemas for LoRA selection on first use.
+    
+    Returns:
+        Tuple of (LoRASelectionResult, LoRASelectionResultLite)
+    """
+    from pydantic import BaseModel, Field
+
+    class LoRASelectionResult(BaseModel):
+        """Result of LLM-based LoRA selection."""
+        selected_loras: List[str] = Field(description="List of selected LoRA names")
+        reasoning: str = Field(description="Explanation of why these LoRAs were selected")
+
+    class LoRASelectionResultLite(BaseModel):
+        """Result of LLM-based LoRA selection without the reasoning text."""
+        selected_loras: List[str] = Field(description="List of selected LoRA names")
+
+    return LoRASelectionResult, LoRASelectionResultLite
+
+
+@functools.lru_cache(maxsize=None)
+def _scene_models() -> Tuple[type, Any]:
+    """
+    Build the scene model and its list validator on first use.
+    
+    Only the fields LoRA selection reads are declared; any other scene keys
+    are ignored.
+    
+    Returns:
+        Tuple of (SceneModel, TypeAdapter for List[SceneModel])
+    """
+    from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+    class SceneModel(BaseModel):
+        """Scene fields used for LoRA selection."""
+        model_config = ConfigDict(extra="ignore")
+
+        location: Optional[str] = None
+        time: Optional[str] = None
+        action: Optional[str] = None
+        characters: List[Dict[str, Any]] = []
+        image_prompt_positive: Optional[str] = None
+        image_prompt_negative: Optional[str] = None
+
+    return SceneModel, TypeAdapter(List[SceneModel])
+
+
+def _validate_scenes(scenes: List[Any]) -> List[Any]:
+    """
+    Validate scene dicts into SceneModel instances in a single pass.
+    
+    Scenes that are already SceneModel instances are passed through.
+    
+    Args:
+        scenes: Scene dicts or SceneModel instances
+        
+    Returns:
+        List of SceneModel instances
+    """
+    return _scene_models()[1].validate_python(scenes)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazily built selection schemas as module attributes."""
+    if name == "LoRASelectionResult":
+        return _selection_schemas()[0]
+    if name == "LoRASelectionResultLite":
+        return _selection_schemas()[1]
+    if name == "SceneModel":
+        return _scene_models()[0]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _llm_retry(description: str) -> Callable:
+    """
+    Build the tenacity retry decorator for LoRA selection LLM calls.
+    
+    The LLM clients do not retry on their own (LLM_MAX_RETRIES is 0), so
+    this decorator alone bounds the attempts made per selection.
+    
+    Args:
+        description: Start of the warning printed before each retry
+        
+    Returns:
+        Retry decorator; the decorated call raises RetryError when all
+        attempts failed
+    """
+    from openai import APIError
+    from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+
+    def log_retry(retry_state):
+        print_warning(f"{description} (attempt {retry_state.attempt_number}): {retry_state.outcome.exception()}")
+        print_warning(f"Retrying in {retry_state.next_action.sleep:.1f} seconds...")
+
+    return retry(
+        stop=stop_after_attempt(GenerationLimits.LLM_MAX_ATTEMPTS),
+        wait=wait_exponential_jitter(
+            initial=GenerationLimits.LLM_RETRY_DELAY_SECONDS,
+            max=GenerationLimits.LLM_RETRY_MAX_DELAY_SECONDS
+        ),
+        # Retry provider/API failures, timeouts and malformed structured output
+        retry=retry_if_exception_type((APIError, TimeoutError, ValueError)),
+        before_sleep=log_retry
+    )
+
+
+def _format_lora_list(
+    heading: str,
+    loras: List[Dict[str, Any]],
+    include_triggers: bool = False
+) -> str:
+    """
+    Format a numbered LoRA list for an LLM prompt.
+    
+    Args:
+        heading: Heading line for the list
+        loras: LoRA configurations with name and description
+        include_triggers: Whether to add a trigger line for LoRAs that have one
+        
+    Returns:
+        Formatted list text, one LoRA per line
+    """
+    lines = [heading]
+    for i, lora in enumerate(loras, 1):
+        lines.append(f"{i}. {lora['name']}: {lora['description']}")
+        if include_triggers and lora.get('trigger'):
+            lines.append(f"   Trigger: {lora['trigger']}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _format_scene_details(heading: str, scene: Any) -> str:
+    """
+    Format the scene fields the LLM conditions on for an LLM prompt.
+    
+    Time and negative prompt lines are only included when the scene has them.
+    
+    Args:
+        heading: Heading line for the scene
+        scene: Validated SceneModel instance
+        
+    Returns:
+        Formatted scene text
+    """
+    lines = ["", heading, f"- Location: {scene.location or 'Unknown'}"]
+    if scene.time:
+        lines.append(f"- Time: {scene.time}")
+    lines.append(f"- Action: {scene.action or 'Unknown'}")
+    lines.append(f"- Characters: {', '.join(char.get('name', 'Unknown') for char in scene.characters)}")
+    lines.append(f"- Visual Style: {scene.image_prompt_positive or 'Unknown'}")
+    if scene.image_prompt_negative:
+        lines.append(f"- Avoid: {scene.image_prompt_negative}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _lora_keywords(lora: Dict[str, Any]) -> List[str]:
+    """
+    Collect the lowercase keyword phrases that identify a LoRA in a prompt.
+    
+    Keywords come from the trigger string, the required trigger words and
+    the essential traits. The free-text description and the optional
+    trigger words are not used since their common words ("anime",
+    "style", ...) would match almost any prompt.
+    
+    Args:
+        lora: LoRA configuration
+        
+    Returns:
+        List of unique keyword phrases
+    """
+    keywords = [t.strip() for t in (lora.get("trigger") or "").split(",")]
+    trigger_words = lora.get("trigger_words") or {}
+    if isinstance(trigger_words, dict):
+        keywords.extend(trigger_words.get("required") or [])
+    keywords.extend(lora.get("essential_traits") or [])
+    return list(dict.fromkeys(k.lower() for k in keywords if k and k.strip()))
+
+
+@functools.lru_cache(maxsize=32)
+def _keyword_matcher(keywords: Tuple[str, ...]) -> Tuple["re.Pattern[str]", Dict[str, Tuple[str, ...]]]:
+    """
+    Compile one whole-phrase pattern for a set of keyword phrases.
+    
+    A phrase matches where it is not directly preceded or followed by a word
+    character, so phrases that start or end with punctuation (e.g. "c++")
+    match as well.
+    
+    Longer phrases are tried first, so at each position the pattern reports
+    the longest phrase found there. Shorter phrases that are whole-phrase
+    prefixes of it also match at that position, so each phrase maps to
+    those implied phrases.
+    
+    Args:
+        keywords: Unique lowercase keyword phrases
+        
+    Returns:
+        Tuple of (compiled pattern, implied phrases per keyword)
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    pattern = re.compile(rf"(?<!\w)(?=({'|'.join(map(re.escape, ordered))})(?!\w))")
+    implied = {
+        keyword: tuple(
+            other for other in keywords
+            if other != keyword and re.match(rf"{re.escape(other)}(?!\w)", keyword)
+        )
+        for keyword in keywords
+    }
+    return pattern, implied
+
+
+def _find_keywords(text: str, keywords: Tuple[str, ...]) -> Set[str]:
+    """
+    Find which keyword phrases appear in text as whole phrases, in one scan.
+    
+    Args:
+        text: Lowercase text to search
+        keywords: Unique lowercase keyword phrases
+        
+    Returns:
+        Set of the phrases found
+    """
+    pattern, implied = _keyword_matcher(keywords)
+    found = set()
+    for match in pattern.finditer(text):
+        keyword = match.group(1)
+        found.add(keyword)
+        found.update(implied[keyword])
+    return found
 
 
 class LoRASelector:
     """LLM-based LoRA selector for group mode."""
     
-    def __init__(self):
-        """Initialize the LoRA selector."""
+    def __init__(self, verbose: bool = False):
+        """
+        Initialize the LoRA selector.
+        
+        Args:
+            verbose: Whether to ask the LLM to explain its selection. The reasoning
+                is only displayed, so it is skipped by default to save output tokens
+                (see LORA_SELECTION_REASONING).
+        """
         self.llm = get_llm()
-        self.llm_with_tools = self.llm.bind_tools([LoRASelectionResult])
+        self.verbose = verbose
+        full_schema, lite_schema = _selection_schemas()
+        self.result_schema = full_schema if verbose else lite_schema
+        self.output_method = config.STRUCTURED_OUTPUT_METHOD
+        self.structured_llm = self._with_schema(self.llm)
+        self._parser_llm = None
+        self._structured_parser_llm = None
+
+    def _with_schema(self, llm: Any) -> Any:
+        """Wrap an LLM client so it returns the selection schema."""
+        return llm.with_structured_output(self.result_schema, method=self.output_method)
+
+    def _invoke_structured(self, messages: List["BaseMessage"], parser: bool = False) -> Any:
+        """
+        Make one structured-output call, falling back to function calling.
+
+        Some OpenAI-compatible providers reject response_format=json_schema
+        with a 400. The selector then switches to function calling for all
+        later calls, which those providers accept.
+
+        Args:
+            messages: Messages to send
+            parser: Whether to call the two-stage parser model instead of the main one
+
+        Returns:
+            Parsed schema instance, or None if the LLM returned nothing
+        """
+        from openai import BadRequestError
+
+        try:
+            return self._structured_runnable(parser).invoke(messages)
+        except BadRequestError as e:
+            if self.output_method == "function_calling":
+                raise
+            print_warning(f"LLM rejected {self.output_method} structured output ({e}); using function calling")
+            self.output_method = "function_calling"
+            self.structured_llm = self._with_schema(self.llm)
+            self._structured_parser_llm = None
+            return self._structured_runnable(parser).invoke(messages)
+
+    def _structured_runnable(self, parser: bool) -> Any:
+        """Get the structured main or parser model, building the parser on first use."""
+        if not parser:
+            return self.structured_llm
+        if self._structured_parser_llm is None:
+            if self._parser_llm is None:
+                self._parser_llm = get_llm({"model": config.LLM_PARSER_MODEL})
+            self._structured_parser_llm = self._with_schema(self._parser_llm)
+        return self._structured_parser_llm
+
+    def _invoke_selection(self, messages: List["BaseMessage"]) -> Dict[str, Any]:
+        """
+        Run the LLM selection and return the parsed result as a dictionary.
+
+        In the default mode a single structured call is made (method set by
+        STRUCTURED_OUTPUT_METHOD). When PARSING_MODE=two_stage, the main model
+        answers in free form first and a cheaper parser model (LLM_PARSER_MODEL)
+        extracts the structured result.
+
+        Args:
+            messages: System and user messages to send to the LLM
+
+        Returns:
+            Dictionary with "selected_loras" and, in verbose mode, "reasoning" keys
+        """
+        if config.PARSING_MODE == "two_stage":
+            from langchain_core.messages import HumanMessage, SystemMessage
+
+            reasoning_text = self.llm.invoke(messages).content
+            extracted = "the selected LoRA names and the reasoning" if self.verbose else "the selected LoRA names"
+            result = self._invoke_structured([
+                SystemMessage(content=f"Extract {extracted} from the analysis below."),
+                HumanMessage(content=reasoning_text)
+            ], parser=True)
+        else:
+            result = self._invoke_structured(messages)
+
+        if result is None:
+            raise ValueError("No structured output returned by LLM")
+
+        return result.model_dump()
+
+    def _try_heuristic(
+        self,
+        scene: Any,
+        optional_loras: List[Dict[str, Any]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Select optional LoRAs for one scene by keyword matching, without calling the LLM.
+        
+        For small catalogs a LoRA whose trigger keywords appear in the image
+        prompt (and not in the negative prompt) is almost always the one the
+        LLM would pick. Disabled by USE_LLM_SELECTOR_ALWAYS=true.
+        
+        Args:
+            scene: Validated SceneModel instance
+            optional_loras: List of LoRAs that can be optionally selected
+            
+        Returns:
+            Matching LoRAs, or None if the LLM should decide
+        """
+        if config.USE_LLM_SELECTOR_ALWAYS:
+            return None
+        if not optional_loras or len(optional_loras) > GenerationLimits.HEURISTIC_SELECTOR_MAX_LORAS:
+            return None
+        
+        positive = (scene.image_prompt_positive or "").lower()
+        negative = (scene.image_prompt_negative or "").lower()
+        
+        # Each prompt is scanned once for the keywords of every LoRA
+        lora_keywords = [_lora_keywords(lora) for lora in optional_loras]
+        all_keywords = tuple(dict.fromkeys(kw for keywords in lora_keywords for kw in keywords))
+        if not all_keywords:
+            return None
+        found_positive = _find_keywords(positive, all_keywords)
+        found_negative = _find_keywords(negative, all_keywords)
+        
+        matches = []
+        for lora, keywords in zip(optional_loras, lora_keywords):
+            if not found_negative.isdisjoint(keywords):
+                continue
+            if not found_positive.isdisjoint(keywords):
+                matches.append(lora)
+        
+        return matches or None
+    
+    def _format_catalog(
+        self,
+        required_loras: List[Dict[str, Any]],
+        optional_loras: List[Dict[str, Any]]
+    ) -> Tuple[str, str, str]:
+        """
+        Format the per-scene system message and LoRA catalog text.
+        
+        The catalog does not change between scenes, so callers selecting for
+        many scenes should compute this once and pass it to select_loras_for_scene.
+        
+        Args:
+            required_loras: List of LoRAs that must always be included
+            optional_loras: List of LoRAs that can be optionally selected
+            
+        Returns:
+            Tuple of (system_message, required_info, optional_info)
+        """
+        system_message = (
+            "You are an expert in visual style selection and LoRA model combinations. "
+            "Your task is to select the most appropriate optional LoRAs for a specific scene "
+            "based on the scene content, image prompts, and LoRA descriptions. "
+            "Pay special attention to the visual style keywords in the image prompt as they directly indicate "
+            "the intended visual style for the generated image. "
+            "Consider the scene's mood, setting, characters, actions, and visual style when making selections."
+        )
+        
+        # Format required and optional LoRAs
+        required_info = _format_lora_list("Required LoRAs (always included):", required_loras)
+        optional_info = _format_lora_list(
+            "Optional LoRAs (select appropriate ones):", optional_loras, include_triggers=True
+        )
+        
+        return system_message, required_info, optional_info
     
     def select_loras_for_all_scenes(
         self,
@@ -50,8 +454,34 @@ class LoRASelector:
         Returns:
             Dictionary with selected LoRAs and reasoning for the entire story
         """
+        # Nothing to decide with zero or one candidate
+        if len(optional_loras) <= 1:
+            reasoning = "Only one optional LoRA available" if optional_loras else "No optional LoRAs available"
+            print_success(f"Story-wide LoRA selection: {reasoning}")
+            return {
+                "selected_loras": list(optional_loras),
+                "reasoning": reasoning,
+                "total_scenes": len(scenes)
+            }
+        
         status_update(f"Analyzing {len(scenes)} scenes to select optimal LoRAs for entire story...", "bright_magenta")
         
+        scenes = _validate_scenes(scenes)
+        
+        # Keywords only replace the LLM when every scene names a LoRA; one
+        # styled scene must not decide the style of the whole story
+        scene_matches = [self._try_heuristic(scene, optional_loras) for scene in scenes]
+        if scene_matches and all(matches is not None for matches in scene_matches):
+            matched_names = {lora["name"] for matches in scene_matches for lora in matches}
+            heuristic_loras = [lora for lora in optional_loras if lora["name"] in matched_names]
+            selected_names = [lora["name"] for lora in heuristic_loras]
+            print_success(f"Story-wide LoRA selection (keyword match): {', '.join(selected_names)}")
+            return {
+                "selected_loras": heuristic_loras,
+                "reasoning": "Selected by matching LoRA trigger keywords in the image prompts",
+                "total_scenes": len(scenes)
+            }
+        
         # Create the prompt for LLM selection
         system_message = (
             "You are an expert in visual style selection and LoRA model combinations for storytelling. "
@@ -64,30 +494,18 @@ class LoRASelector:
         )
         
         # Format all scenes information
-        scenes_description = "All Story Scenes:\n"
-        for i, scene in enumerate(scenes, 1):
-            scene_description = f"""
-Scene {i}:
-- Location: {scene.get('location', 'Unknown')}
-- Time: {scene.get('time', 'Unknown')}
-- Action: {scene.get('action', 'Unknown')}
-- Characters: {', '.join([char.get('name', 'Unknown') for char in scene.get('characters', [])])}
-- Visual Style: {scene.get('image_prompt_positive', 'Unknown')}
-- Avoid: {scene.get('image_prompt_negative', 'None')}
-"""
-            scenes_description += scene_description
-        
-        # Format required LoRAs
-        required_info = "Required LoRAs (always included):\n"
-        for i, lora in enumerate(required_loras, 1):
-            required_info += f"{i}. {lora['name']}: {lora['description']}\n"
+        scene_parts = ["All Story Scenes:\n"]
+        scene_parts.extend(
+            _format_scene_details(f"Scene {i}:", scene)
+            for i, scene in enumerate(scenes, 1)
+        )
+        scenes_description = "".join(scene_parts)
         
-        # Format optional LoRAs
-        optional_info = "Optional LoRAs (select best ones for entire story):\n"
-        for i, lora in enumerate(optional_loras, 1):
-            optional_info += f"{i}. {lora['name']}: {lora['description']}\n"
-            if lora.get('trigger'):
-                optional_info += f"   Trigger: {lora['trigger']}\n"
+        # Format required and optional LoRAs
+        required_info = _format_lora_list("Required LoRAs (always included):", required_loras)
+        optional_info = _format_lora_list(
+            "Optional LoRAs (select best ones for entire story):", optional_loras, include_triggers=True
+        )
         
         # Create selection prompt
         selection_prompt = f"""
@@ -113,51 +531,46 @@ Guidelines for Story-Wide LoRA Selection:
 Select the LoRA names exactly as they appear in the list above.
 """
         
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("user", selection_prompt)
-        ])
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        messages = [
+            SystemMessage(content=system_message),
+            HumanMessage(content=selection_prompt)
+        ]
+        
+        from tenacity import RetryError
         
+        @_llm_retry("Error in story-wide LLM LoRA selection")
         def try_select():
-            chain = prompt | self.llm_with_tools
-            output = chain.invoke({})
-            
-            if not hasattr(output, "tool_calls") or not output.tool_calls:
-                raise ValueError("No tool calls found in LLM output")
-            
-            if len(output.tool_calls) == 0:
-                raise ValueError("Empty tool calls list")
-            
-            selection_result = output.tool_calls[0]["args"]
+            selection_result = self._invoke_selection(messages)
             
-            # Validate selected LoRAs
-            valid_lora_names = {lora["name"] for lora in optional_loras}
+            # Validate selected LoRAs against the optional catalog
+            optional_by_name = {lora["name"]: lora for lora in optional_loras}
             selected_names = selection_result["selected_loras"]
             
-            # Filter out invalid selections
-            valid_selections = [name for name in selected_names if name in valid_lora_names]
+            # Filter out invalid selections (and duplicates), keeping LLM order
+            valid_selections = list(dict.fromkeys(
+                name for name in selected_names if name in optional_by_name
+            ))
             
-            if len(valid_selections) != len(selected_names):
-                invalid_selections = [name for name in selected_names if name not in valid_lora_names]
+            invalid_selections = [name for name in selected_names if name not in optional_by_name]
+            if invalid_selections:
                 print_warning(f"Invalid LoRA selections filtered out: {invalid_selections}")
             
             # Get the actual LoRA configs for selected names
-            selected_lora_configs = []
-            for lora in optional_loras:
-                if lora["name"] in valid_selections:
-                    selected_lora_configs.append(lora)
+            selected_lora_configs = [optional_by_name[name] for name in valid_selections]
             
             result = {
                 "selected_loras": selected_lora_configs,
-                "reasoning": selection_result["reasoning"],
+                "reasoning": selection_result.get("reasoning") or _LLM_SELECTION_NOTE,
                 "total_scenes": len(scenes)
             }
             
             # Log the selection
             if selected_lora_configs:
-                selected_names = [lora["name"] for lora in selected_lora_configs]
-                print_success(f"Story-wide LoRA selection: {', '.join(selected_names)}")
-                print_success(f"Reasoning: {selection_result['reasoning']}")
+                print_success(f"Story-wide LoRA selection: {', '.join(valid_selections)}")
+                if selection_result.get("reasoning"):
+                    print_success(f"Reasoning: {selection_result['reasoning']}")
             else:
                 print_success(f"Story-wide LoRA selection: No optional LoRAs selected")
                 
@@ -177,20 +590,12 @@ Select the LoRA names exactly as they appear in the list above.
             print_warning(f"Using fallback LoRA selection: {', '.join(selected_names)}")
             return result
         
-        max_attempts = 3
-        attempt = 0
-        last_exception = None
-        while attempt < max_attempts:
-            try:
-                return try_select()
-            except Exception as e:
-                attempt += 1
-                last_exception = e
-                print_warning(f"Error in story-wide LLM LoRA selection (attempt {attempt}): {str(e)}")
-                if attempt < max_attempts:
-                    print_warning(f"Retrying in {GenerationLimits.LLM_RETRY_DELAY_SECONDS} seconds...")
-                    time.sleep(GenerationLimits.LLM_RETRY_DELAY_SECONDS)
-        print_warning(f"All {max_attempts} attempts failed. Using fallback selection.")
+        try:
+            return try_select()
+        except RetryError:
+            print_warning(f"All {GenerationLimits.LLM_MAX_ATTEMPTS} attempts failed. Using fallback selection.")
+        except Exception as e:
+            print_warning(f"Non-retryable error in story-wide LLM LoRA selection: {str(e)}")
         return fallback()
 
     def select_loras_for_scene(
@@ -199,7 +604,8 @@ Select the LoRA names exactly as they appear in the list above.
         required_loras: List[Dict[str, Any]],
         optional_loras: List[Dict[str, Any]],
         scene_index: int,
-        total_scenes: int
+        total_scenes: int,
+        catalog: Optional[Tuple[str, str, str]] = None
     ) -> Dict[str, Any]:
         """
         Select LoRAs for a specific scene using LLM intelligence.
@@ -210,50 +616,44 @@ Select the LoRA names exactly as they appear in the list above.
             optional_loras: List of LoRAs that can be optionally selected
             scene_index: Index of current scene (0-based)
             total_scenes: Total number of scenes
+            catalog: Optional precomputed result of _format_catalog for these LoRAs
             
         Returns:
             Dictionary with selected LoRAs and reasoning
         """
-        status_update(f"Scene {scene_index + 1}/{total_scenes}: Selecting LoRAs using LLM...", "bright_magenta")
+        # Nothing to decide with zero or one candidate
+        if len(optional_loras) <= 1:
+            reasoning = "Only one optional LoRA available" if optional_loras else "No optional LoRAs available"
+            return {
+                "selected_loras": list(optional_loras),
+                "reasoning": reasoning,
+                "scene_index": scene_index
+            }
         
-        # Create the prompt for LLM selection
-        system_message = (
-            "You are an expert in visual style selection and LoRA model combinations. "
-            "Your task is to select the most appropriate optional LoRAs for a specific scene "
-            "based on the scene content, image prompts, and LoRA descriptions. "
-            "Pay special attention to the visual style keywords in the image prompt as they directly indicate "
-            "the intended visual style for the generated image. "
-            "Consider the scene's mood, setting, characters, actions, and visual style when making selections."
-        )
+        scene = _validate_scenes([scene])[0]
+        heuristic_loras = self._try_heuristic(scene, optional_loras)
+        if heuristic_loras is not None:
+            selected_names = [lora["name"] for lora in heuristic_loras]
+            print_success(f"Scene {scene_index + 1}: Selected optional LoRAs by keyword match: {', '.join(selected_names)}")
+            return {
+                "selected_loras": heuristic_loras,
+                "reasoning": "Selected by matching LoRA trigger keywords in the image prompt",
+                "scene_index": scene_index
+            }
         
-        # Format scene information
-        scene_description = f"""
-Scene Details:
-- Location: {scene.get('location', 'Unknown')}
-- Time: {scene.get('time', 'Unknown')}
-- Action: {scene.get('action', 'Unknown')}
-- Characters: {', '.join([char.get('name', 'Unknown') for char in scene.get('characters', [])])}
-- Visual Style: {scene.get('image_prompt_positive', 'Unknown')}
-- Avoid: {scene.get('image_prompt_negative', 'None')}
-"""
+        status_update(f"Scene {scene_index + 1}/{total_scenes}: Selecting LoRAs using LLM...", "bright_magenta")
         
-        # Format required LoRAs
-        required_info = "Required LoRAs (always included):\n"
-        for i, lora in enumerate(required_loras, 1):
-            required_info += f"{i}. {lora['name']}: {lora['description']}\n"
+        if catalog is None:
+            catalog = self._format_catalog(required_loras, optional_loras)
+        system_message, required_info, optional_info = catalog
         
-        # Format optional LoRAs
-        optional_info = "Optional LoRAs (select appropriate ones):\n"
-        for i, lora in enumerate(optional_loras, 1):
-            optional_info += f"{i}. {lora['name']}: {lora['description']}\n"
-            if lora.get('trigger'):
-                optional_info += f"   Trigger: {lora['trigger']}\n"
+        # Format scene information
+        scene_description = _format_scene_details("Scene Details:", scene)
         
-        # Create selection prompt
+        # Create selection prompt. The LoRA catalog and guidelines are identical
+        # for every scene, so they come first to form a cacheable prompt prefix.
         selection_prompt = f"""
-Based on the scene description, image prompts, and available LoRAs, select the most appropriate optional LoRAs for this scene.
-
-{scene_description}
+Based on the scene description, image prompts, and available LoRAs, select the most appropriate optional LoRAs for the scene described at the end.
 
 {required_info}
 
@@ -269,52 +669,44 @@ Guidelines:
 7. If no optional LoRAs are suitable, select none
 
 Select the LoRA names exactly as they appear in the list above.
-"""
+{scene_description}"""
         
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_message),
-            ("user", selection_prompt)
-        ])
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        messages = [
+            SystemMessage(content=system_message),
+            HumanMessage(content=selection_prompt)
+        ]
         
+        @_llm_retry(f"Scene {scene_index + 1}: Error in LLM LoRA selection")
         def try_select():
-            chain = prompt | self.llm_with_tools
-            output = chain.invoke({})
-            
-            if not hasattr(output, "tool_calls") or not output.tool_calls:
-                raise ValueError("No tool calls found in LLM output")
+            selection_result = self._invoke_selection(messages)
             
-            if len(output.tool_calls) == 0:
-                raise ValueError("Empty tool calls list")
-            
-            selection_result = output.tool_calls[0]["args"]
-            
-            # Validate selected LoRAs
-            valid_lora_names = {lora["name"] for lora in optional_loras}
+            # Validate selected LoRAs against the optional catalog
+            optional_by_name = {lora["name"]: lora for lora in optional_loras}
             selected_names = selection_result["selected_loras"]
             
-            # Filter out invalid selections
-            valid_selections = [name for name in selected_names if name in valid_lora_names]
+            # Filter out invalid selections (and duplicates), keeping LLM order
+            valid_selections = list(dict.fromkeys(
+                name for name in selected_names if name in optional_by_name
+            ))
             
-            if len(valid_selections) != len(selected_names):
-                invalid_selections = [name for name in selected_names if name not in valid_lora_names]
+            invalid_selections = [name for name in selected_names if name not in optional_by_name]
+            if invalid_selections:
                 print_warning(f"Scene {scene_index + 1}: Invalid LoRA selections filtered out: {invalid_selections}")
             
             # Get the actual LoRA configs for selected names
-            selected_lora_configs = []
-            for lora in optional_loras:
-                if lora["name"] in valid_selections:
-                    selected_lora_configs.append(lora)
+            selected_lora_configs = [optional_by_name[name] for name in valid_selections]
             
             result = {
                 "selected_loras": selected_lora_configs,
-                "reasoning": selection_result["reasoning"],
+                "reasoning": selection_result.get("reasoning") or _LLM_SELECTION_NOTE,
                 "scene_index": scene_index
             }
             
             # Log the selection
             if selected_lora_configs:
-                selected_names = [lora["name"] for lora in selected_lora_configs]
-                print_success(f"Scene {scene_index + 1}: Selected optional LoRAs: {', '.join(selected_names)}")
+                print_success(f"Scene {scene_index + 1}: Selected optional LoRAs: {', '.join(valid_selections)}")
             else:
                 print_success(f"Scene {scene_index + 1}: No optional LoRAs selected")
                 
@@ -334,11 +726,44 @@ Select the LoRA names exactly as they appear in the list above.
             print_warning(f"Scene {scene_index + 1}: Using fallback LoRA selection: {', '.join(selected_names)}")
             return result
         
+        from tenacity import RetryError
+        
         try:
             return try_select()
+        except RetryError:
+            print_warning(f"Scene {scene_index + 1}: All {GenerationLimits.LLM_MAX_ATTEMPTS} attempts failed.")
         except Exception as e:
             print_warning(f"Scene {scene_index + 1}: Error in LLM LoRA selection: {str(e)}")
-            return fallback()
+        return fallback()
+    
+    # Defaults for optional LoRA settings used when building generation configs
+    _LORA_DEFAULTS = {
+        "trigger": "",
+        "strength_model": 1.0,
+        "strength_clip": 1.0,
+        "trigger_words": {},
+        "essential_traits": [],
+    }
+    
+    def _prepare_lora(self, lora: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the generation settings for a single LoRA, filling in defaults.
+        
+        Args:
+            lora: LoRA configuration with at least name and file
+            
+        Returns:
+            LoRA settings dictionary for image generation
+        """
+        return {
+            "name": lora["name"],
+            "file": lora["file"],
+            # Copy defaults so callers never share the mutable class-level ones
+            **{
+                key: lora[key] if key in lora else copy.copy(default)
+                for key, default in self._LORA_DEFAULTS.items()
+            }
+        }
     
     def combine_loras_for_generation(
         self,
@@ -361,59 +786,43 @@ Select the LoRA names exactly as they appear in the list above.
         if not all_loras:
             return None
         
-        # Collect all triggers
-        all_triggers = []
-        for lora in all_loras:
-            if lora.get("trigger"):
-                all_triggers.append(lora["trigger"])
+        prepared_loras = [self._prepare_lora(lora) for lora in all_loras]
         
         # Create combined configuration
-        if len(all_loras) == 1:
+        if len(prepared_loras) == 1:
             # Single LoRA
-            lora = all_loras[0]
-            config = {
-                "name": lora["name"],
-                "file": lora["file"],
-                "trigger": lora.get("trigger", ""),
-                "strength_model": lora.get("strength_model", 1.0),
-                "strength_clip": lora.get("strength_clip", 1.0),
-                "trigger_words": lora.get("trigger_words", {}),
-                "essential_traits": lora.get("essential_traits", []),
-                "is_multiple": False
-            }
-            # Preserve additional config like seed
-            if preserve_config:
-                for key, value in preserve_config.items():
-                    if key not in config:  # Don't override LoRA-specific settings
-                        config[key] = value
-            return config
+            config = {**prepared_loras[0], "is_multiple": False}
         else:
             # Multiple LoRAs
-            prepared_loras = []
-            for lora in all_loras:
-                prepared_lora = {
-                    "name": lora["name"],
-                    "file": lora["file"],
-                    "trigger": lora.get("trigger", ""),
-                    "strength_model": lora.get("strength_model", 1.0),
-                    "strength_clip": lora.get("strength_clip", 1.0),
-                    "trigger_words": lora.get("trigger_words", {}),
-                    "essential_traits": lora.get("essential_traits", [])
-                }
-                prepared_loras.append(prepared_lora)
-            
             config = {
                 "is_multiple": True,
                 "loras": prepared_loras,
-                "trigger": ", ".join(all_triggers),
+                "trigger": ", ".join(lora["trigger"] for lora in prepared_loras if lora["trigger"]),
                 "name": f"Combined LoRAs ({len(prepared_loras)} total)"
             }
-            # Preserve additional config like seed
-            if preserve_config:
-                for key, value in preserve_config.items():
-                    if key not in config:  # Don't override LoRA-specific settings
-                        config[key] = value
-            return config
+        
+        # Preserve additional config like seed
+        if preserve_config:
+            for key, value in preserve_config.items():
+                if key not in config:  # Don't override LoRA-specific settings
+                    config[key] = value
+        
+        return config
+
+
+@functools.lru_cache(maxsize=None)
+def _get_selector() -> LoRASelector:
+    """
+    Get the shared LoRA selector, building its LLM clients on first use.
+
+    The selector lives for the whole process, so it must only hold the LLM
+    clients, never state derived from a story or group config. Whether the
+    LLM explains its selection is set by LORA_SELECTION_REASONING.
+
+    Returns:
+        LoRASelector reused across selection calls
+    """
+    return LoRASelector(verbose=config.LORA_SELECTION_REASONING)
 
 
 def select_loras_for_all_scenes_optimized(
@@ -439,12 +848,17 @@ def select_loras_for_all_scenes_optimized(
     if group_config.get("mode") != "group":
         raise ValueError("This function is only for group mode")
     
-    # Verify that scenes have image prompts
-    for i, scene in enumerate(scenes):
-        if not scene.get("image_prompt_positive"):
-            raise ValueError(f"Scene {i+1} missing image_prompt_positive - prompts must be generated before LoRA selection")
+    # Validate scenes once; the selector reads the fields by attribute from here on
+    scenes = _validate_scenes(scenes)
     
-    selector = LoRASelector()
+    # Verify that scenes have image prompts, reporting all missing ones at once
+    missing = [i + 1 for i, scene in enumerate(scenes) if not scene.image_prompt_positive]
+    if missing:
+        raise ValueError(
+            f"Scenes missing image_prompt_positive: {missing} - prompts must be generated before LoRA selection"
+        )
+    
+    selector = _get_selector()
     
     required_loras = group_config.get("required_loras", [])
     optional_loras = group_config.get("optional_loras", [])
@@ -497,7 +911,7 @@ def select_loras_for_scenes(
     if group_config.get("mode") != "group":
         raise ValueError("This function is only for group mode")
     
-    selector = LoRASelector()
+    selector = _get_selector()
     scene_lora_configs = []
     
     required_loras = group_config.get("required_loras", [])
@@ -505,16 +919,30 @@ def select_loras_for_scenes(
     
     status_update(f"Selecting LoRAs for {len(scenes)} scenes in group mode...", "bright_magenta")
     
-    for i, scene in enumerate(scenes):
-        # Select LoRAs for this scene
-        selection_result = selector.select_loras_for_scene(
+    # Validate all scenes in one pass instead of once per selection call
+    scenes = _validate_scenes(scenes)
+    
+    # The LoRA catalog is the same for every scene, so format it only once
+    catalog = selector._format_catalog(required_loras, optional_loras)
+    
+    def select_for_scene(indexed_scene):
+        i, scene = indexed_scene
+        return selector.select_loras_for_scene(
             scene=scene,
             required_loras=required_loras,
             optional_loras=optional_loras,
             scene_index=i,
-            total_scenes=len(scenes)
+            total_scenes=len(scenes),
+            catalog=catalog
         )
-        
+    
+    # LLM calls are I/O bound, so select for several scenes concurrently.
+    # executor.map yields results in scene order.
+    max_workers = max(1, min(GenerationLimits.MAX_CONCURRENT_LLM_CALLS, len(scenes)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        selection_results = list(executor.map(select_for_scene, enumerate(scenes)))
+    
+    for i, selection_result in enumerate(selection_results):
         # Combine required and selected optional LoRAs
         combined_config = selector.combine_loras_for_generation(
             required_loras=required_loras,
@@ -3,19 +3,45 @@
 This module handles the configuration and initialization of the
 Large Language Model provider."""
 
-from typing import Any, Dict, Optional
-
-from langchain_openai import ChatOpenAI
+import functools
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from ykgen.config.config import config
+from ykgen.config.constants import GenerationLimits
+
+if TYPE_CHECKING:
+    import httpx
+    from langchain_openai import ChatOpenAI
+
+
+@functools.lru_cache(maxsize=None)
+def _get_http_client() -> "httpx.Client":
+    """
+    Get the process-wide HTTP client shared by all LLM instances.
+
+    Reusing one connection pool keeps TCP/TLS connections alive across
+    LLM instances instead of each one opening its own.
+
+    Returns:
+        httpx.Client: Shared HTTP client with connection pool limits
+    """
+    import httpx
+
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=GenerationLimits.LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=GenerationLimits.LLM_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
 
 
-def get_llm(params: Optional[Dict[str, Any]] = None) -> ChatOpenAI:
+def get_llm(params: Optional[Dict[str, Any]] = None) -> "ChatOpenAI":
     """
     Get an LLM instance configured from environment variables.
 
     Args:
-        params: Optional parameters for the LLM
+        params: Optional parameters for the LLM, overriding the defaults
+            (e.g. ``{"model": "..."}``)
 
     Returns:
         ChatOpenAI: Configured LLM instance
@@ -29,9 +55,25 @@ def get_llm(params: Optional[Dict[str, Any]] = None) -> ChatOpenAI:
             "LLM_API_KEY environment variable is required"
         )
 
-    return ChatOpenAI(
-        api_key=api_key,
-        model=config.LLM_MODEL,
-        base_url=config.LLM_BASE_URL,
-        timeout=1000000,
-    )
+    # Imported lazily: langchain_openai is slow to import and not every
+    # entry point needs an LLM
+    import httpx
+    from langchain_openai import ChatOpenAI
+
+    # Bound every request so a hung upstream cannot stall the pipeline and
+    # callers' retry/fallback logic gets a chance to run
+    llm_kwargs: Dict[str, Any] = {
+        "api_key": api_key,
+        "model": config.LLM_MODEL,
+        "base_url": config.LLM_BASE_URL,
+        "timeout": httpx.Timeout(
+            config.LLM_TIMEOUT_SECONDS,
+            connect=GenerationLimits.LLM_CONNECT_TIMEOUT_SECONDS,
+        ),
+        "max_retries": GenerationLimits.LLM_MAX_RETRIES,
+        "http_client": _get_http_client(),
+    }
+    if params:
+        llm_kwargs.update(params)
+
+    return ChatOpenAI(**llm_kwargs)
@@ -5,33 +5,88 @@ This module contains common utility functions used throughout the application,
 including retry logic, validation helpers, and file operations.
 """
 
+import asyncio
 import functools
+import logging
 import os
+import random
+import secrets
+import stat
 import time
-import uuid
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Callable, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 from ykgen.config.constants import FileDefaults, GenerationLimits
 from ykgen.config.exceptions import FileOperationError, RetryExhaustedError, ValidationError, YKGenError
 
 T = TypeVar('T')
 
+logger = logging.getLogger(__name__)
+
+# Filename cleanup table, built once at import time
+_FILENAME_TRANSLATE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Exact in binary floating point since MB_DIVISOR is a power of two
+_MB_RECIP = 1.0 / FileDefaults.MB_DIVISOR
+
+
+def _backoff_delay(
+    attempt: int,
+    delay: float,
+    exponential: bool,
+    max_delay: float,
+    jitter: float
+) -> float:
+    """
+    Compute the jittered delay before the next retry.
+    
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        delay: Initial delay between retries in seconds
+        exponential: Whether to use exponential backoff
+        max_delay: Upper bound for the delay before jitter is applied
+        jitter: Fraction of the delay to randomize (0 disables jitter)
+        
+    Returns:
+        Delay in seconds
+    """
+    current_delay = min(max_delay, delay * (2 ** attempt) if exponential else delay)
+    return current_delay * (1 + random.uniform(-jitter, jitter))
+
+
+def _log_retry(attempt: int, error: Exception, delay: float) -> None:
+    """Default retry report of the retry decorators."""
+    logger.warning("Attempt %d failed: %s. Retrying in %.1fs...", attempt, error, delay)
+
 
 def retry_with_backoff(
     max_retries: int = GenerationLimits.MAX_RETRIES,
     delay: float = GenerationLimits.RETRY_DELAY_SECONDS,
     exponential: bool = False,
-    exceptions: tuple = (Exception,)
+    exceptions: tuple = (Exception,),
+    max_delay: float = GenerationLimits.RETRY_MAX_DELAY_SECONDS,
+    jitter: float = GenerationLimits.RETRY_JITTER,
+    unrecoverable: tuple = (),
+    on_retry: Optional[Callable[[int, Exception, float], None]] = None
 ) -> Callable:
     """
     Decorator for retrying functions with configurable backoff.
     
+    Each delay is capped at max_delay and randomized by +/- jitter so that
+    concurrent callers retrying the same service do not retry in lockstep.
+    
     Args:
         max_retries: Maximum number of retry attempts
         delay: Initial delay between retries in seconds
         exponential: Whether to use exponential backoff
         exceptions: Tuple of exceptions to catch and retry on
+        max_delay: Upper bound for the delay before jitter is applied
+        jitter: Fraction of the delay to randomize (0 disables jitter)
+        unrecoverable: Tuple of exceptions that are re-raised immediately
+        on_retry: Optional callback reporting a failed attempt, called with the
+            1-based attempt number, its exception and the delay before the next
+            attempt (default: a warning on the module logger)
         
     Returns:
         Decorated function with retry logic
@@ -39,24 +94,26 @@ def retry_with_backoff(
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            last_exception = None
-            current_delay = delay
+            # First attempt outside the loop: most calls succeed right away
+            try:
+                return func(*args, **kwargs)
+            except unrecoverable:
+                raise
+            except exceptions as e:
+                last_exception = e
             
-            for attempt in range(max_retries + 1):
+            for attempt in range(max_retries):
+                current_delay = _backoff_delay(attempt, delay, exponential, max_delay, jitter)
+                (on_retry or _log_retry)(attempt + 1, last_exception, current_delay)
+                time.sleep(current_delay)
+                
                 try:
                     return func(*args, **kwargs)
+                except unrecoverable:
+                    raise
                 except exceptions as e:
                     last_exception = e
-                    
-                    if attempt == max_retries:
-                        break
-                        
-                    print(f"Attempt {attempt + 1} failed: {e}. Retrying in {current_delay}s...")
-                    time.sleep(current_delay)
-                    
-                    if exponential:
-                        current_delay *= 2
-                        
+            
             raise RetryExhaustedError(
                 operation=func.__name__,
                 max_retries=max_retries,
@@ -67,18 +124,119 @@ def retry_with_backoff(
     return decorator
 
 
-def validate_file_exists(file_path: str, description: str = "File") -> None:
+def retry_with_backoff_async(
+    max_retries: int = GenerationLimits.MAX_RETRIES,
+    delay: float = GenerationLimits.RETRY_DELAY_SECONDS,
+    exponential: bool = False,
+    exceptions: tuple = (Exception,),
+    max_delay: float = GenerationLimits.RETRY_MAX_DELAY_SECONDS,
+    jitter: float = GenerationLimits.RETRY_JITTER,
+    unrecoverable: tuple = (),
+    on_retry: Optional[Callable[[int, Exception, float], None]] = None
+) -> Callable:
+    """
+    Decorator for retrying coroutine functions with configurable backoff.
+    
+    Same behavior as retry_with_backoff, but waits with asyncio.sleep so the
+    event loop keeps running other tasks during the backoff.
+    
+    Args:
+        max_retries: Maximum number of retry attempts
+        delay: Initial delay between retries in seconds
+        exponential: Whether to use exponential backoff
+        exceptions: Tuple of exceptions to catch and retry on
+        max_delay: Upper bound for the delay before jitter is applied
+        jitter: Fraction of the delay to randomize (0 disables jitter)
+        unrecoverable: Tuple of exceptions that are re-raised immediately
+        on_retry: Optional callback reporting a failed attempt, called with the
+            1-based attempt number, its exception and the delay before the next
+            attempt (default: a warning on the module logger)
+        
+    Returns:
+        Decorated coroutine function with retry logic
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            # First attempt outside the loop: most calls succeed right away
+            try:
+                return await func(*args, **kwargs)
+            except unrecoverable:
+                raise
+            except exceptions as e:
+                last_exception = e
+            
+            for attempt in range(max_retries):
+                current_delay = _backoff_delay(attempt, delay, exponential, max_delay, jitter)
+                (on_retry or _log_retry)(attempt + 1, last_exception, current_delay)
+                await asyncio.sleep(current_delay)
+                
+                try:
+                    return await func(*args, **kwargs)
+                except unrecoverable:
+                    raise
+                except exceptions as e:
+                    last_exception = e
+            
+            raise RetryExhaustedError(
+                operation=func.__name__,
+                max_retries=max_retries,
+                last_error=last_exception
+            )
+            
+        return wrapper
+    return decorator
+
+
+def batch_stat(paths: Iterable[str], max_workers: int = 1) -> Dict[str, Optional[os.stat_result]]:
+    """
+    Stat several paths in one pass.
+    
+    Callers that validate and size the same files can stat them once here
+    and pass the results on instead of issuing one syscall per check.
+    
+    Args:
+        paths: Paths to stat
+        max_workers: Number of threads to stat with (useful on network filesystems)
+        
+    Returns:
+        Dictionary mapping each path to its stat result, or None if it doesn't exist
+    """
+    def stat_or_none(path: str) -> Optional[os.stat_result]:
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+    
+    paths = list(dict.fromkeys(paths))
+    if max_workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+            return dict(zip(paths, executor.map(stat_or_none, paths)))
+    return {path: stat_or_none(path) for path in paths}
+
+
+def validate_file_exists(
+    file_path: str,
+    description: str = "File",
+    stat_result: Optional[os.stat_result] = None
+) -> None:
     """
     Validate that a file exists.
     
     Args:
         file_path: Path to the file
         description: Description of the file for error messages
+        stat_result: Optional pre-fetched stat result (e.g. from batch_stat)
         
     Raises:
-        ValidationError: If file doesn't exist
+        ValidationError: If file doesn't exist or is not a regular file
     """
-    if not os.path.exists(file_path):
+    if stat_result is not None:
+        is_file = stat.S_ISREG(stat_result.st_mode)
+    else:
+        is_file = os.path.isfile(file_path)
+    
+    if not is_file:
         raise ValidationError(f"{description} not found: {file_path}")
 
 
@@ -95,16 +253,18 @@ def validate_directory_exists(dir_path: str, create: bool = False) -> str:
         
     Raises:
         ValidationError: If directory doesn't exist and create=False
+        FileOperationError: If the directory cannot be created
     """
-    if not os.path.exists(dir_path):
-        if create:
-            try:
-                os.makedirs(dir_path, exist_ok=True)
-                print(f"Created directory: {dir_path}")
-            except OSError as e:
-                raise FileOperationError(f"Failed to create directory {dir_path}: {e}")
-        else:
-            raise ValidationError(f"Directory not found: {dir_path}")
+    if create:
+        # exist_ok makes a separate existence check unnecessary
+        try:
+            os.makedirs(dir_path, exist_ok=True)
+        except OSError as e:
+            raise FileOperationError(f"Failed to create directory {dir_path}: {e}")
+        return dir_path
+    
+    if not os.path.isdir(dir_path):
+        raise ValidationError(f"Directory not found: {dir_path}")
     
     return dir_path
 
@@ -120,7 +280,7 @@ def generate_output_directory(base_dir: str = "output") -> str:
         Path to the generated directory
     """
     timestamp = datetime.now().strftime(FileDefaults.TIMESTAMP_FORMAT)
-    unique_suffix = str(uuid.uuid4())[:8]
+    unique_suffix = secrets.token_hex(4)
     
     output_dir = f"{base_dir}/{timestamp}_images4story_{unique_suffix}"
     return validate_directory_exists(output_dir, create=True)
@@ -146,23 +306,42 @@ def safe_file_operation(operation: Callable[[], T], description: str) -> T:
         raise FileOperationError(f"Failed to {description}: {e}")
 
 
-def calculate_file_size_mb(file_path: str) -> float:
+def calculate_file_size_mb(file_path: str, stat_result: Optional[os.stat_result] = None) -> float:
     """
     Calculate file size in megabytes.
     
     Args:
         file_path: Path to the file
+        stat_result: Optional pre-fetched stat result (e.g. from batch_stat)
         
     Returns:
-        File size in MB rounded to 1 decimal place
+        File size in MB rounded to 1 decimal place, or 0.0 if the file
+        cannot be stat'ed
     """
     try:
-        size_bytes = os.path.getsize(file_path)
-        return round(size_bytes / FileDefaults.MB_DIVISOR, 1)
+        return round(file_size_mb(file_path, stat_result=stat_result), 1)
     except OSError:
         return 0.0
 
 
+def file_size_mb(file_path: str, *, stat_result: Optional[os.stat_result] = None) -> float:
+    """
+    Get the unrounded file size in megabytes with a single stat call.
+    
+    Args:
+        file_path: Path to the file
+        stat_result: Optional pre-fetched stat result (e.g. from batch_stat)
+        
+    Returns:
+        File size in MB (round when formatting for display)
+        
+    Raises:
+        OSError: If the file cannot be stat'ed
+    """
+    st = stat_result or os.stat(file_path)
+    return st.st_size * _MB_RECIP
+
+
 def format_duration(seconds: int) -> str:
     """
     Format duration in seconds to human-readable format.
@@ -176,22 +355,18 @@ def format_duration(seconds: int) -> str:
     if seconds < 60:
         return f"{seconds}s"
     
-    minutes = seconds // 60
-    remaining_seconds = seconds % 60
-    
+    minutes, remaining_seconds = divmod(seconds, 60)
     if minutes < 60:
         return f"{minutes}m {remaining_seconds}s" if remaining_seconds > 0 else f"{minutes}m"
     
-    hours = minutes // 60
-    remaining_minutes = minutes % 60
-    
-    parts = [f"{hours}h"]
+    hours, remaining_minutes = divmod(minutes, 60)
+    if remaining_minutes > 0 and remaining_seconds > 0:
+        return f"{hours}h {remaining_minutes}m {remaining_seconds}s"
     if remaining_minutes > 0:
-        parts.append(f"{remaining_minutes}m")
+        return f"{hours}h {remaining_minutes}m"
     if remaining_seconds > 0:
-        parts.append(f"{remaining_seconds}s")
-    
-    return " ".join(parts)
+        return f"{hours}h {remaining_seconds}s"
+    return f"{hours}h"
 
 
 def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
@@ -206,10 +381,7 @@ def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
     Returns:
         Truncated string
     """
-    if len(text) <= max_length:
-        return text
-    
-    return text[:max_length - len(suffix)] + suffix
+    return text if len(text) <= max_length else text[:max_length - len(suffix)] + suffix
 
 
 def validate_positive_integer(value: Any, name: str, minimum: int = 1) -> int:
@@ -227,6 +399,14 @@ def validate_positive_integer(value: Any, name: str, minimum: int = 1) -> int:
     Raises:
         ValidationError: If validation fails
     """
+    if isinstance(value, bool):
+        raise ValidationError(f"{name} must be an integer, got bool")
+    
+    if isinstance(value, int):
+        if value < minimum:
+            raise ValidationError(f"{name} must be at least {minimum}, got {value}")
+        return value
+    
     try:
         int_value = int(value)
         if int_value < minimum:
@@ -240,41 +420,77 @@ def batch_process(
     items: List[T],
     processor: Callable[[T], Any],
     batch_size: int = 5,
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None
 ) -> List[Any]:
     """
     Process items in batches with optional progress reporting.
     
+    Items are processed one after another unless an executor or max_workers
+    is given; then the items of each batch run concurrently, so at most
+    batch_size items are in flight at a time and the processor must be
+    thread-safe. Results keep the input order either way.
+    
     Args:
         items: List of items to process
         processor: Function to process each item
         batch_size: Number of items to process at once
         progress_callback: Optional callback for progress updates
+        executor: Optional shared executor to run the processor on
+        max_workers: Number of threads for a pool owned by this call
+            (ignored when executor is given)
         
     Returns:
-        List of processed results
+        List of processed results (None for items that failed)
     """
     results = []
     total_items = len(items)
+    if total_items == 0:
+        return results
     
-    for i in range(0, total_items, batch_size):
-        batch = items[i:i + batch_size]
-        
-        for item in batch:
-            try:
-                result = processor(item)
-                results.append(result)
-            except Exception as e:
-                print(f"Error processing item: {e}")
-                results.append(None)
-        
-        if progress_callback:
+    progress_callback = progress_callback or (lambda completed, total: None)
+    
+    pool = executor
+    if pool is None and max_workers:
+        pool = ThreadPoolExecutor(max_workers=min(max_workers, batch_size, total_items))
+    try:
+        for i in range(0, total_items, batch_size):
+            batch = items[i:i + batch_size]
+            errors = []
+            
+            if pool is None:
+                for item in batch:
+                    try:
+                        results.append(processor(item))
+                    except Exception as e:
+                        errors.append(e)
+                        results.append(None)
+            else:
+                futures = [pool.submit(processor, item) for item in batch]
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        errors.append(e)
+                        results.append(None)
+            
             completed = min(i + batch_size, total_items)
+            if errors:
+                # One log record per batch rather than one per failed item
+                logger.warning(
+                    "Items %d-%d: %d failed: %s",
+                    i + 1, completed, len(errors), "; ".join(str(e) for e in errors)
+                )
             progress_callback(completed, total_items)
+    finally:
+        if pool is not None and executor is None:
+            pool.shutdown()
     
     return results
 
 
+@functools.lru_cache(maxsize=4096)
 def clean_filename(filename: str) -> str:
     """
     Clean a filename by removing or replacing invalid characters.
@@ -285,12 +501,8 @@ def clean_filename(filename: str) -> str:
     Returns:
         Cleaned filename safe for filesystem use
     """
-    # Remove or replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    cleaned = filename
-    
-    for char in invalid_chars:
-        cleaned = cleaned.replace(char, '_')
+    # Replace invalid characters in a single pass
+    cleaned = filename.translate(_FILENAME_TRANSLATE)
     
     # Remove extra spaces and dots
     cleaned = ' '.join(cleaned.split())  # Normalize whitespace
@@ -299,6 +511,7 @@ def clean_filename(filename: str) -> str:
     return cleaned or "untitled"
 
 
+@functools.lru_cache(maxsize=4096)
 def ensure_file_extension(filename: str, extension: str) -> str:
     """
     Ensure a filename has the correct extension.
@@ -313,7 +526,8 @@ def ensure_file_extension(filename: str, extension: str) -> str:
     if not extension.startswith('.'):
         extension = '.' + extension
     
-    if not filename.lower().endswith(extension.lower()):
-        return filename + extension
+    # Lowercase only the extension and the same-length tail of the filename
+    if filename[-len(extension):].lower() == extension.lower():
+        return filename
     
-    return filename
\ No newline at end of file
+    return filename + extension
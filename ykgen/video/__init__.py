@@ -4,25 +4,48 @@ Video generation modules for YKGen.
 This package contains video generation, processing, and management components.
 """
 
-from .siliconflow_client import (
-    VideoGenerationClient,
-    VideoGenerationTask,
-    generate_videos_from_images,
-    wait_for_all_videos,
-    combine_videos,
-    combine_videos_with_transitions,
-    combine_scene_videos,
-)
-
-from .base_video_client import BaseVideoClient
-from .client_factory import (
-    create_video_client,
-    get_video_provider_info,
-    validate_video_provider_config,
-    get_supported_providers,
-    get_configured_providers,
-)
-from .video_manager import VideoTaskMonitor, VideoResultProcessor, VideoQualityManager
+import importlib
+from typing import Any
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# ykgen.video does not pull in requests/ffmpeg helpers until they are used.
+_LAZY = {
+    # SiliconFlow API
+    "VideoGenerationClient": "siliconflow_client",
+    "VideoGenerationTask": "siliconflow_client",
+    "generate_videos_from_images": "siliconflow_client",
+    "wait_for_all_videos": "siliconflow_client",
+    "combine_videos": "siliconflow_client",
+    "combine_videos_with_transitions": "siliconflow_client",
+    "combine_scene_videos": "siliconflow_client",
+    "combine_scene_videos_with_audio": "siliconflow_client",
+    "configure_pool": "siliconflow_client",
+    "run_video_tasks_async": "siliconflow_client",
+    # Video Prompts
+    "build_conservative_video_prompt": "conservative_prompt",
+    # Base Video Client
+    "BaseVideoClient": "base_video_client",
+    # Video Client Factory
+    "create_video_client": "client_factory",
+    "get_video_provider_info": "client_factory",
+    "validate_video_provider_config": "client_factory",
+    "get_supported_providers": "client_factory",
+    "get_configured_providers": "client_factory",
+    # Video Management
+    "VideoTaskMonitor": "video_manager",
+    "VideoResultProcessor": "video_manager",
+    "VideoQualityManager": "video_manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names from their submodule on first access."""
+    if name in _LAZY:
+        module = importlib.import_module(f".{_LAZY[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -34,7 +57,12 @@ __all__ = [
     "combine_videos",
     "combine_videos_with_transitions",
     "combine_scene_videos",
+    "combine_scene_videos_with_audio",
+    "configure_pool",
+    "run_video_tasks_async",
     
+    # Video Prompts
+    "build_conservative_video_prompt",
     # Base Video Client
     "BaseVideoClient",
     # Video Client Factory
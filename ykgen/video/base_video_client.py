@@ -7,10 +7,12 @@ to ensure consistent behavior across different providers.
 
 import base64
 import os
+import shutil
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
 import requests
+import urllib3
 
 from ..console import (
     print_success,
@@ -41,9 +43,13 @@ class BaseVideoClient(ABC):
 
     def _encode_image_to_base64(self, image_path: str) -> str:
         """Encode an image file to base64 string."""
+        # Encode in chunks whose size is a multiple of 3 so no padding is
+        # emitted between chunks, without holding a full raw copy in memory
+        encoded = bytearray(b"data:image/png;base64,")
         with open(image_path, "rb") as image_file:
-            encoded = base64.b64encode(image_file.read()).decode("utf-8")
-            return f"data:image/png;base64,{encoded}"
+            while chunk := image_file.read(57 * 1024):
+                encoded += base64.b64encode(chunk)
+        return encoded.decode("ascii")
 
     def _get_api_key_display(self) -> str:
         """Get API key display string for logging."""
@@ -137,19 +143,30 @@ class BaseVideoClient(ABC):
             True if successful, False otherwise
         """
         try:
-            video_response = requests.get(video_url, **self.request_kwargs)
-            video_response.raise_for_status()
-
-            # Save the video
-            with open(output_path, "wb") as f:
-                f.write(video_response.content)
-
-            file_size = len(video_response.content) / (1024 * 1024)  # MB
+            # Stream to disk so memory use stays at one chunk per download
+            download_kwargs = {
+                "timeout": (
+                    VideoDefaults.DOWNLOAD_CONNECT_TIMEOUT_SECONDS,
+                    VideoDefaults.DOWNLOAD_READ_TIMEOUT_SECONDS,
+                ),
+                **self.request_kwargs,
+            }
+            with requests.get(video_url, stream=True, **download_kwargs) as video_response:
+                video_response.raise_for_status()
+
+                # Save the video, copying from the raw stream without a
+                # bytes object per chunk; decode_content undoes any gzip
+                video_response.raw.decode_content = True
+                with open(output_path, "wb") as f:
+                    shutil.copyfileobj(video_response.raw, f, VideoDefaults.DOWNLOAD_CHUNK_SIZE)
+                    total_bytes = f.tell()
+
+            file_size = total_bytes / (1024 * 1024)  # MB
             key_display = self._get_api_key_display()
             print_success(f"Video downloaded successfully using Key {key_display}")
             print_success(f"   └─ Saved to: {output_path} ({file_size:.1f} MB)")
             return True
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
             print_warning(f"Error downloading video: {e}")
             return False
\ No newline at end of file
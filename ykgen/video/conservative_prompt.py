@@ -0,0 +1,106 @@
+"""
+Conservative video prompts for YKGen.
+
+This module builds the SiliconFlow image-to-video prompts, which describe
+the scene's setting and keep character movement to a minimum.
+"""
+
+import re
+from typing import Any, Dict, Optional, Tuple
+
+# Environmental motion categories in priority order: (category, words found
+# in a scene action, prompt hint). Matching is case-insensitive substring.
+_MOTION_RULES = (
+    ("wind", ("wind", "breeze", "flowing", "rippling", "ripples"), "gentle environmental movement"),
+    ("light", ("light", "glow", "shine", "sparkle"), "subtle lighting effects"),
+)
+_MOTION_RE = re.compile(
+    "|".join(f"(?P<{category}>{'|'.join(map(re.escape, words))})" for category, words, _ in _MOTION_RULES),
+    re.IGNORECASE,
+)
+_MOTION_HINTS = {category: hint for category, _, hint in _MOTION_RULES}
+_MOTION_PRIORITY = {category: rank for rank, (category, _, _) in enumerate(_MOTION_RULES)}
+
+# Fixed parts of the conservative video prompts
+_VIDEO_PROMPT_STILLNESS = ", ".join((
+    "stable composition",
+    "minimal character movement",
+    "environmental ambience",
+    "subtle lighting changes only",
+    "camera remains still",
+))
+_VIDEO_NEGATIVE_PROMPT = ", ".join((
+    "too much movement",
+    "excessive motion",
+    "fast movement",
+    "rapid action",
+    "dramatic gestures",
+    "sudden changes",
+    "camera shake",
+    "blurry motion",
+    "distorted movement",
+))
+
+
+def _motion_category(scene_action: str) -> Optional[str]:
+    """
+    Classify the environmental motion a scene action mentions.
+
+    Earlier rules take precedence, so the scan stops at the first word of
+    the top-priority category.
+
+    Args:
+        scene_action: Action text of the scene
+
+    Returns:
+        Category of the highest-priority rule matched, or None
+    """
+    motion = None
+    for match in _MOTION_RE.finditer(scene_action):
+        if motion is None or _MOTION_PRIORITY[match.lastgroup] < _MOTION_PRIORITY[motion]:
+            motion = match.lastgroup
+            if _MOTION_PRIORITY[motion] == 0:
+                break
+    return motion
+
+
+def build_conservative_video_prompt(scene: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Build the video prompt and negative prompt for a scene.
+
+    Character actions are not described; at most a gentle environmental
+    or lighting movement is hinted, followed by wording that keeps the
+    composition and camera still.
+
+    Args:
+        scene: Scene with optional "location", "time", "action" and
+            "image_prompt_negative" keys
+
+    Returns:
+        Tuple of (video prompt, negative prompt)
+    """
+    prompt_parts = []
+
+    # Start with static atmospheric elements only
+    scene_location = scene.get("location", "")
+    scene_time = scene.get("time", "")
+    if scene_location:
+        prompt_parts.append(f"static scene at {scene_location}")
+    if scene_time:
+        prompt_parts.append(f"during {scene_time}")
+
+    # Minimize character movement - focus on environment instead of actions;
+    # any other action just gets minimal movement
+    scene_action = scene.get("action", "")
+    if scene_action:
+        prompt_parts.append(_MOTION_HINTS.get(_motion_category(scene_action), "minimal movement"))
+
+    prompt_parts.append(_VIDEO_PROMPT_STILLNESS)
+
+    base_negative = scene.get("image_prompt_negative", "")
+    if base_negative:
+        negative_prompt = f"{base_negative}, {_VIDEO_NEGATIVE_PROMPT}"
+    else:
+        negative_prompt = _VIDEO_NEGATIVE_PROMPT
+
+    return ", ".join(prompt_parts), negative_prompt
@@ -5,15 +5,27 @@ This module handles video generation from images using the SiliconFlow API
 with Wan-AI models.
 """
 
+import asyncio
+import atexit
 import base64
+import collections
+import functools
+import json
 import os
+import random
+import re
+import shutil
 import subprocess
+import tempfile
 import threading
 import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 
 from ..console import (
     print_info,
@@ -22,7 +34,209 @@ from ..console import (
     status_update,
 )
 from ykgen.config.config import config
-from ykgen.config.constants import VideoDefaults
+from ykgen.config.constants import NetworkDefaults, VideoDefaults
+from ykgen.config.exceptions import RetryExhaustedError, VideoStatusFailure
+from ..utils import retry_with_backoff_async
+from .conservative_prompt import build_conservative_video_prompt
+
+try:
+    import orjson
+except ImportError:  # Optional faster JSON encoder
+    orjson = None
+
+try:
+    import av
+except ImportError:  # Optional in-process media probing, ffprobe is used otherwise
+    av = None
+
+if TYPE_CHECKING:
+    import httpx
+
+T = TypeVar("T")
+
+
+# Case-insensitive matchers for error messages that are worth retrying
+_RETRYABLE_KEYWORDS = (
+    "502", "503", "504", "Bad Gateway", "Service Unavailable",
+    "Gateway Timeout", "Connection", "Network", "Timeout",
+)
+_RETRYABLE_FAILURE_RE = re.compile("|".join(map(re.escape, _RETRYABLE_KEYWORDS)), re.IGNORECASE)
+_RETRYABLE_ERROR_RE = re.compile(
+    "|".join(map(re.escape, _RETRYABLE_KEYWORDS + ("RequestException",))), re.IGNORECASE
+)
+
+# H.264 software encode settings (libx264)
+_LIBX264_ENCODE_ARGS = (
+    "-c:v",
+    "libx264",
+    "-pix_fmt",
+    "yuv420p",
+    "-profile:v",
+    "high",
+    "-level",
+    "4.0",
+    "-crf",
+    str(VideoDefaults.CRF_VALUE),
+    "-preset",
+    "medium",
+)
+
+# Hardware H.264 encoders at comparable quality, in order of preference
+_HW_ENCODE_ARGS = {
+    "h264_nvenc": (
+        "-c:v",
+        "h264_nvenc",
+        "-pix_fmt",
+        "yuv420p",
+        "-profile:v",
+        "high",
+        "-preset",
+        "p4",
+        "-tune",
+        "hq",
+        "-rc",
+        "vbr",
+        "-cq",
+        str(VideoDefaults.CRF_VALUE),
+        "-b:v",
+        "0",
+    ),
+    "h264_qsv": (
+        "-c:v",
+        "h264_qsv",
+        "-pix_fmt",
+        "nv12",
+        "-profile:v",
+        "high",
+        "-preset",
+        "medium",
+        "-global_quality",
+        str(VideoDefaults.CRF_VALUE),
+    ),
+}
+
+# H.264 re-encode settings used when a stream copy is not possible and no
+# hardware encoder is used
+_COMPAT_ENCODE_ARGS = (*_LIBX264_ENCODE_ARGS, "-movflags", "+faststart")
+
+# ffmpeg input options reading a concat demuxer list from stdin
+_CONCAT_STDIN_INPUT = (
+    "-protocol_whitelist",
+    "file,pipe",
+    "-f",
+    "concat",
+    "-safe",
+    "0",
+    "-i",
+    "pipe:0",
+)
+
+# Audio codecs that can be stream-copied into an MP4 container
+_MP4_COPYABLE_AUDIO_CODECS = ("aac", "mp3")
+
+
+def _format_key_display(api_key: str) -> str:
+    """
+    Format an API key for log messages.
+
+    The full key is only shown when YKGEN_DEBUG_KEYS=true.
+
+    Args:
+        api_key: API key to display
+
+    Returns:
+        Display string for the key
+    """
+    if not api_key:
+        return "unknown"
+    if os.getenv("YKGEN_DEBUG_KEYS", "false").lower() == "true":
+        return api_key
+    return f"*{api_key[-8:]}"
+
+
+def _dumps_json(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a request payload to JSON bytes.
+
+    Uses orjson when installed, which is noticeably faster for the
+    multi-megabyte base64 image in submit payloads.
+
+    Args:
+        payload: JSON-serializable request payload
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+# Sessions are shared per API key so that all scene threads using the same
+# key share one urllib3 connection pool.
+_SESSIONS: Dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+_pool_maxsize = NetworkDefaults.POOL_MAXSIZE
+
+
+def configure_pool(size: int) -> None:
+    """
+    Set the per-host connection pool size for sessions created afterwards.
+
+    Use a size at least as large as the number of concurrent scenes.
+
+    Args:
+        size: Maximum number of keep-alive connections per host
+    """
+    global _pool_maxsize
+    _pool_maxsize = size
+
+
+def _close_all_sessions() -> None:
+    """Close all shared sessions."""
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+
+atexit.register(_close_all_sessions)
+
+# Hedged status requests of all clients share one bounded pool
+_HEDGE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=VideoDefaults.STATUS_HEDGE_MAX_WORKERS, thread_name_prefix="hedge"
+)
+atexit.register(_HEDGE_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+
+
+def _discard_response(future: "Future[requests.Response]") -> None:
+    """Close the response of a losing hedged request, freeing its connection."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+@functools.lru_cache(maxsize=32)
+def _encode_image_cached(image_path: str, mtime_ns: int) -> str:
+    """
+    Encode an image file to a base64 data URI, cached per path and mtime.
+
+    Retried submissions reuse the encoded payload; a regenerated image has a
+    new mtime and is encoded again.
+
+    Args:
+        image_path: Path to the image
+        mtime_ns: Modification time of the image in nanoseconds (cache key only)
+
+    Returns:
+        Base64 data URI of the image
+    """
+    # Encode in chunks whose size is a multiple of 3 so no padding is
+    # emitted between chunks, without holding a full raw copy in memory
+    encoded = bytearray(b"data:image/png;base64,")
+    with open(image_path, "rb") as image_file:
+        while chunk := image_file.read(57 * 1024):
+            encoded += base64.b64encode(chunk)
+    return encoded.decode("ascii")
 
 
 class VideoGenerationClient:
@@ -44,12 +258,134 @@ class VideoGenerationClient:
         }
         # Initialize request kwargs
         self.request_kwargs = {}
+        self._key_display = _format_key_display(api_key)
+        self.upload_mode = VideoDefaults.UPLOAD_MODE
+
+        # Keep-alive connections are reused across submit, status polling and
+        # download. Auth headers are passed per API call rather than set on the
+        # session so they are not sent to the video download host.
+        self.session = self._get_session(api_key)
+
+    @classmethod
+    def _get_session(cls, api_key: str) -> requests.Session:
+        """
+        Get the shared session for an API key, creating it on first use.
+
+        Args:
+            api_key: SiliconFlow API key
+
+        Returns:
+            Session with a pooled HTTP adapter mounted
+        """
+        with _SESSIONS_LOCK:
+            session = _SESSIONS.get(api_key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=NetworkDefaults.POOL_CONNECTIONS,
+                    pool_maxsize=_pool_maxsize,
+                    max_retries=0,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _SESSIONS[api_key] = session
+            return session
+
+    def close(self) -> None:
+        """
+        Close the pooled connections of this client's session.
+
+        The session is shared with other clients using the same API key;
+        closed connections are reopened on demand.
+        """
+        self.session.close()
+
+    def __enter__(self) -> "VideoGenerationClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def _encode_image_to_base64(self, image_path: str) -> str:
         """Encode an image file to base64 string."""
+        return _encode_image_cached(image_path, os.stat(image_path).st_mtime_ns)
+
+    @staticmethod
+    def _build_submit_payload(
+        image_base64: str,
+        prompt: str,
+        model: str,
+        image_size: str,
+        negative_prompt: Optional[str],
+        seed: Optional[int],
+    ) -> Dict[str, Any]:
+        """Build the JSON payload for a video submission."""
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "image_size": image_size,
+            "image": image_base64,
+        }
+
+        if negative_prompt:
+            payload["negative_prompt"] = negative_prompt
+        if seed is not None:
+            payload["seed"] = seed
+        return payload
+
+    def _post_multipart(
+        self,
+        url: str,
+        image_path: str,
+        prompt: str,
+        model: str,
+        image_size: str,
+        negative_prompt: Optional[str],
+        seed: Optional[int],
+    ) -> requests.Response:
+        """
+        Submit a video request with the image uploaded as a raw file.
+
+        Avoids the base64 encode and the larger JSON body.
+
+        Args:
+            url: Submit endpoint URL
+            image_path: Path to the input image
+            prompt: Text prompt for video generation
+            model: Model to use for generation
+            image_size: Output video size
+            negative_prompt: Negative prompt (optional)
+            seed: Random seed (optional)
+
+        Returns:
+            Response of the submit request
+        """
+        data = self._build_multipart_fields(prompt, model, image_size, negative_prompt, seed)
         with open(image_path, "rb") as image_file:
-            encoded = base64.b64encode(image_file.read()).decode("utf-8")
-            return f"data:image/png;base64,{encoded}"
+            files = {"image": (os.path.basename(image_path), image_file, "image/png")}
+            return self.session.post(
+                url, data=data, files=files, headers=self._multipart_headers(), **self.request_kwargs
+            )
+
+    @staticmethod
+    def _build_multipart_fields(
+        prompt: str,
+        model: str,
+        image_size: str,
+        negative_prompt: Optional[str],
+        seed: Optional[int],
+    ) -> Dict[str, str]:
+        """Build the form fields of a multipart video submission."""
+        data = {"model": model, "prompt": prompt, "image_size": image_size}
+        if negative_prompt:
+            data["negative_prompt"] = negative_prompt
+        if seed is not None:
+            data["seed"] = str(seed)
+        return data
+
+    def _multipart_headers(self) -> Dict[str, str]:
+        """Get the headers of a multipart submission (the HTTP client sets the Content-Type)."""
+        return {"Authorization": self.headers["Authorization"]}
 
     def submit_video_generation(
         self,
@@ -76,37 +412,27 @@ class VideoGenerationClient:
         """
         url = f"{self.base_url}/video/submit"
 
-        # Encode image to base64
-        image_base64 = self._encode_image_to_base64(image_path)
-
-        payload = {
-            "model": model,
-            "prompt": prompt,
-            "image_size": image_size,
-            "image": image_base64,
-        }
-
-        if negative_prompt:
-            payload["negative_prompt"] = negative_prompt
-        if seed is not None:
-            payload["seed"] = seed
-
         try:
-            response = requests.post(url, json=payload, headers=self.headers, **self.request_kwargs)
+            if self.upload_mode == "multipart":
+                response = self._post_multipart(url, image_path, prompt, model, image_size, negative_prompt, seed)
+                if response.status_code in VideoDefaults.MULTIPART_REJECTED_STATUS_CODES:
+                    print_warning(
+                        f"Multipart upload rejected (HTTP {response.status_code}), falling back to base64"
+                    )
+                    self.upload_mode = "base64"
+            if self.upload_mode != "multipart":
+                # Encode image to base64
+                image_base64 = self._encode_image_to_base64(image_path)
+                payload = self._build_submit_payload(image_base64, prompt, model, image_size, negative_prompt, seed)
+                body = _dumps_json(payload)
+                response = self.session.post(url, data=body, headers=self.headers, **self.request_kwargs)
             response.raise_for_status()
 
             data = response.json()
             request_id = data.get("requestId")
             
-            # Show full key for debugging if environment variable is set
-            show_full_key = os.getenv("YKGEN_DEBUG_KEYS", "false").lower() == "true"
-            if show_full_key:
-                key_display = self.api_key if self.api_key else "unknown"
-            else:
-                key_display = f"*{self.api_key[-8:]}" if self.api_key else "unknown"
-            
             status_update(
-                f"✅ Video generation submitted (Key: {key_display}, Request ID: {request_id})", "green"
+                f"✅ Video generation submitted (Key: {self._key_display}, Request ID: {request_id})", "green"
             )
             return request_id
 
@@ -124,9 +450,13 @@ class VideoGenerationClient:
             request_id: The request ID returned by submit_video_generation
 
         Returns:
-            Status response dictionary
+            Status response dictionary; a failed check is reported as a
+            "Failed" status with the error as reason
         """
-        return self._check_video_status_with_retry(request_id)
+        try:
+            return self._check_video_status_with_retry(request_id)
+        except VideoStatusFailure as e:
+            return {"status": "Failed", "reason": e.reason}
 
     def _check_video_status_with_retry(self, request_id: str, attempt: int = 1) -> Dict[str, Any]:
         """
@@ -134,45 +464,106 @@ class VideoGenerationClient:
         
         Args:
             request_id: The request ID to check
-            attempt: Current attempt number (1-based)
+            attempt: Attempt number to start counting from (1-based)
             
         Returns:
             Status response dictionary
+
+        Raises:
+            VideoStatusFailure: If the check failed; retryable is set when
+                only transient server or connection errors were seen
         """
         url = f"{self.base_url}/video/status"
-        payload = {"requestId": request_id}
-
-        try:
-            response = requests.post(url, json=payload, headers=self.headers, **self.request_kwargs)
-            response.raise_for_status()
-            return response.json()
+        body = _dumps_json({"requestId": request_id})
 
-        except requests.exceptions.RequestException as e:
-            # Check if this is a retryable error (502, 503, 504, connection errors)
-            is_retryable = (
-                (hasattr(e, 'response') and e.response is not None and e.response.status_code in [502, 503, 504]) or
-                isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
-            )
-            
-            if is_retryable and attempt < VideoDefaults.MAX_RETRY_ATTEMPTS:
-                # Calculate delay with exponential backoff
-                if VideoDefaults.RETRY_EXPONENTIAL_BACKOFF:
-                    delay = VideoDefaults.RETRY_DELAY_SECONDS * (2 ** (attempt - 1))
+        while True:
+            try:
+                if attempt == 1:
+                    response = self._hedged_post(url, body)
                 else:
-                    delay = VideoDefaults.RETRY_DELAY_SECONDS
+                    response = self.session.post(url, data=body, headers=self.headers, **self.request_kwargs)
+                    response.raise_for_status()
+                return response.json()
+
+            except requests.exceptions.RequestException as e:
+                # Check if this is a retryable error (502, 503, 504, connection errors)
+                is_retryable = (
+                    (hasattr(e, 'response') and e.response is not None and e.response.status_code in [502, 503, 504]) or
+                    isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+                )
+                
+                if not is_retryable or attempt >= VideoDefaults.MAX_RETRY_ATTEMPTS:
+                    # Max retries reached or non-retryable error
+                    if attempt >= VideoDefaults.MAX_RETRY_ATTEMPTS:
+                        print_warning(f"Max retries ({VideoDefaults.MAX_RETRY_ATTEMPTS}) reached for video status check: {e}")
+                    else:
+                        print_warning(f"Non-retryable error checking video status: {e}")
+                    raise VideoStatusFailure(str(e), retryable=is_retryable) from e
                 
+                delay = self._retry_delay(attempt)
                 print_warning(f"Error checking video status (attempt {attempt}/{VideoDefaults.MAX_RETRY_ATTEMPTS}): {e}")
                 print_warning(f"Retrying in {delay} seconds...")
                 
                 time.sleep(delay)
-                return self._check_video_status_with_retry(request_id, attempt + 1)
-            else:
-                # Max retries reached or non-retryable error
-                if attempt >= VideoDefaults.MAX_RETRY_ATTEMPTS:
-                    print_warning(f"Max retries ({VideoDefaults.MAX_RETRY_ATTEMPTS}) reached for video status check: {e}")
-                else:
-                    print_warning(f"Non-retryable error checking video status: {e}")
-                return {"status": "Failed", "reason": str(e)}
+                attempt += 1
+
+    def _hedged_post(
+        self,
+        url: str,
+        body: bytes,
+        hedge_after: float = VideoDefaults.STATUS_HEDGE_AFTER_SECONDS,
+    ) -> requests.Response:
+        """
+        POST an idempotent request, sending one duplicate if the first is slow.
+
+        The duplicate is only sent if the first request has not completed
+        after hedge_after seconds; the first successful response wins.
+
+        Args:
+            url: Request URL
+            body: Serialized JSON payload
+            hedge_after: Seconds to wait before sending the duplicate request
+
+        Returns:
+            The first successful response
+
+        Raises:
+            requests.exceptions.RequestException: If all sent requests failed
+        """
+        def post() -> requests.Response:
+            response = self.session.post(url, data=body, headers=self.headers, **self.request_kwargs)
+            response.raise_for_status()
+            return response
+
+        futures = [_HEDGE_EXECUTOR.submit(post)]
+        done, _ = wait(futures, timeout=hedge_after)
+        if not done:
+            futures.append(_HEDGE_EXECUTOR.submit(post))
+
+        winner = None
+        try:
+            last_error = None
+            for future in as_completed(futures):
+                try:
+                    winner = future
+                    return future.result()
+                except requests.exceptions.RequestException as e:
+                    winner = None
+                    last_error = e
+            raise last_error
+        finally:
+            # The slower request is not waited for: a queued one is dropped,
+            # a running one has its response closed when it completes
+            for future in futures:
+                if future is not winner and not future.cancel():
+                    future.add_done_callback(_discard_response)
+
+    @staticmethod
+    def _retry_delay(attempt: int) -> int:
+        """Get the delay before retrying after the given (1-based) attempt."""
+        if VideoDefaults.RETRY_EXPONENTIAL_BACKOFF:
+            return VideoDefaults.RETRY_DELAY_SECONDS * (1 << (attempt - 1))
+        return VideoDefaults.RETRY_DELAY_SECONDS
 
     def wait_and_download_video(
         self,
@@ -215,175 +606,521 @@ class VideoGenerationClient:
             max_wait_time: Maximum time to wait in seconds
             check_interval: Interval between status checks in seconds
             scene_name: Optional scene name for better logging
-            attempt: Current attempt number (1-based)
+            attempt: Attempt number to start counting from (1-based)
             
         Returns:
             True if successful, False otherwise
         """
-        start_time = time.time()
+        while True:
+            # Add retry information to logging
+            if attempt > 1:
+                status_update(f"🔄 Retry attempt {attempt}/{VideoDefaults.MAX_RETRY_ATTEMPTS} for {scene_name or 'video'}", "yellow")
+            
+            error_reason = self._wait_and_download_once(
+                request_id, output_path, max_wait_time, check_interval, scene_name
+            )
+            if error_reason is None:
+                return True
+            if error_reason is False or attempt >= VideoDefaults.MAX_RETRY_ATTEMPTS:
+                return False
+            
+            print_warning(f"Will retry download for {scene_name or 'video'}")
+            delay = self._retry_delay(attempt)
+            print_warning(f"Retrying in {delay} seconds... (Reason: {error_reason})")
+            time.sleep(delay)
+            attempt += 1
 
-        # Show full key for debugging if environment variable is set
-        import os
-        show_full_key = os.getenv("YKGEN_DEBUG_KEYS", "false").lower() == "true"
-        
-        if show_full_key:
-            key_display = self.api_key if self.api_key else "unknown"
-        else:
-            key_display = f"*{self.api_key[-8:]}" if self.api_key else "unknown"
-        
-        # Add retry information to logging
-        if attempt > 1:
-            status_update(f"🔄 Retry attempt {attempt}/{VideoDefaults.MAX_RETRY_ATTEMPTS} for {scene_name or 'video'}", "yellow")
+    def _wait_and_download_once(
+        self,
+        request_id: str,
+        output_path: str,
+        max_wait_time: int,
+        check_interval: int,
+        scene_name: str,
+    ):
+        """
+        Wait for video generation and download the result once.
         
+        Args:
+            request_id: The request ID to monitor
+            output_path: Path where to save the video
+            max_wait_time: Maximum time to wait in seconds
+            check_interval: Interval between status checks in seconds
+            scene_name: Optional scene name for better logging
+            
+        Returns:
+            None if the video was downloaded, the reason string if the attempt
+            may be retried, or False if it failed permanently
+        """
+        key_display = self._key_display
+        start_time = time.time()
+        poll_count = 0
+        poll_interval = check_interval
+        last_status = None
+
         while time.time() - start_time < max_wait_time:
-            status_response = self.check_video_status(request_id)
+            try:
+                status_response = self._check_video_status_with_retry(request_id)
+            except VideoStatusFailure as e:
+                # Stop polling a request whose status can no longer be read
+                return e.reason if e.retryable else False
             status = status_response.get("status")
 
-            elapsed_time = int(time.time() - start_time)
-            
             # Enhanced logging with scene context
-            if scene_name:
-                status_update(f"📊 {scene_name} status: {status} (Key: {key_display}, elapsed: {elapsed_time}s)", "cyan")
-            else:
-                status_update(f"📊 Video status: {status} (Key: {key_display}, elapsed: {elapsed_time}s)", "cyan")
+            if self._should_log_poll(poll_count, status, last_status):
+                elapsed_time = int(time.time() - start_time)
+                if scene_name:
+                    status_update(f"📊 {scene_name} status: {status} (Key: {key_display}, elapsed: {elapsed_time}s)", "cyan")
+                else:
+                    status_update(f"📊 Video status: {status} (Key: {key_display}, elapsed: {elapsed_time}s)", "cyan")
+            last_status = status
 
             if status == "Succeed":
                 # Download the video
                 results = status_response.get("results", {})
                 videos = results.get("videos", [])
 
-                if videos and videos[0].get("url"):
-                    video_url = videos[0]["url"]
-                    status_update(f"Downloading video...", "bright_cyan")
-
-                    try:
-                        video_response = requests.get(video_url, **self.request_kwargs)
+                if not (videos and videos[0].get("url")):
+                    print_warning("No video URL in response")
+                    return "No video URL in response"
+
+                video_url = videos[0]["url"]
+                status_update(f"Downloading video...", "bright_cyan")
+
+                try:
+                    # Stream to disk so memory use stays at one chunk per download
+                    download_kwargs = {
+                        "timeout": (
+                            VideoDefaults.DOWNLOAD_CONNECT_TIMEOUT_SECONDS,
+                            VideoDefaults.DOWNLOAD_READ_TIMEOUT_SECONDS,
+                        ),
+                        **self.request_kwargs,
+                    }
+                    with self.session.get(video_url, stream=True, **download_kwargs) as video_response:
                         video_response.raise_for_status()
 
-                        # Save the video
+                        # Save the video, copying from the raw stream without a
+                        # bytes object per chunk; decode_content undoes any gzip
+                        video_response.raw.decode_content = True
                         with open(output_path, "wb") as f:
-                            f.write(video_response.content)
+                            shutil.copyfileobj(video_response.raw, f, VideoDefaults.DOWNLOAD_CHUNK_SIZE)
+                            total_bytes = f.tell()
 
-                        file_size = len(video_response.content) / (1024 * 1024)  # MB
-                        print_success(f"Video downloaded successfully using Key {key_display}")
-                        print_success(f"   └─ Saved to: {output_path} ({file_size:.1f} MB)")
-                        return True
+                    file_size = total_bytes / (1024 * 1024)  # MB
+                    print_success(f"Video downloaded successfully using Key {key_display}")
+                    print_success(f"   └─ Saved to: {output_path} ({file_size:.1f} MB)")
+                    return None
 
-                    except requests.exceptions.RequestException as e:
-                        print_warning(f"Error downloading video: {e}")
-                        # Check if download should be retried
-                        if attempt < VideoDefaults.MAX_RETRY_ATTEMPTS:
-                            print_warning(f"Will retry download for {scene_name or 'video'}")
-                            return self._retry_download(request_id, output_path, max_wait_time, check_interval, scene_name, attempt, str(e))
-                        return False
-                else:
-                    print_warning("No video URL in response")
-                    # Check if this should be retried
-                    if attempt < VideoDefaults.MAX_RETRY_ATTEMPTS:
-                        print_warning(f"Will retry download for {scene_name or 'video'}")
-                        return self._retry_download(request_id, output_path, max_wait_time, check_interval, scene_name, attempt, "No video URL in response")
-                    return False
+                except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+                    print_warning(f"Error downloading video: {e}")
+                    return str(e)
 
             elif status == "Failed":
                 reason = status_response.get("reason", "Unknown error")
                 print_warning(f"Video generation failed: {reason}")
                 # Check if this failure should be retried
-                if attempt < VideoDefaults.MAX_RETRY_ATTEMPTS and self._is_retryable_failure(reason):
-                    print_warning(f"Will retry download for {scene_name or 'video'}")
-                    return self._retry_download(request_id, output_path, max_wait_time, check_interval, scene_name, attempt, reason)
-                return False
+                return reason if self._is_retryable_failure(reason) else False
 
             # Still in progress, wait before checking again
-            time.sleep(check_interval)
+            poll_count += 1
+            sleep_time, poll_interval = self._next_poll_sleep(poll_count, poll_interval, check_interval)
+            remaining = max_wait_time - (time.time() - start_time)
+            time.sleep(max(0, min(sleep_time, remaining)))
 
         print_warning(
             f"Timeout waiting for video generation after {max_wait_time} seconds"
         )
-        # Check if timeout should be retried
-        if attempt < VideoDefaults.MAX_RETRY_ATTEMPTS:
-            print_warning(f"Will retry download for {scene_name or 'video'}")
-            return self._retry_download(request_id, output_path, max_wait_time, check_interval, scene_name, attempt, "Timeout")
-        return False
+        return "Timeout"
 
-    def _is_retryable_failure(self, reason: str) -> bool:
-        """Check if a failure reason indicates a retryable error."""
-        retryable_keywords = [
-            "502", "503", "504", "Bad Gateway", "Service Unavailable", 
-            "Gateway Timeout", "Connection", "Network", "Timeout"
-        ]
-        return any(keyword.lower() in reason.lower() for keyword in retryable_keywords)
+    @staticmethod
+    def _should_log_poll(poll_count: int, status: Optional[str], last_status: Optional[str]) -> bool:
+        """
+        Decide whether to print a status poll result.
 
-    def _retry_download(self, request_id: str, output_path: str, max_wait_time: int, 
-                       check_interval: int, scene_name: str, attempt: int, error_reason: str) -> bool:
-        """Handle retry logic for failed downloads."""
-        # Calculate delay with exponential backoff
-        if VideoDefaults.RETRY_EXPONENTIAL_BACKOFF:
-            delay = VideoDefaults.RETRY_DELAY_SECONDS * (2 ** (attempt - 1))
-        else:
-            delay = VideoDefaults.RETRY_DELAY_SECONDS
-        
-        print_warning(f"Retrying in {delay} seconds... (Reason: {error_reason})")
-        time.sleep(delay)
-        
-        return self._wait_and_download_with_retry(
-            request_id, output_path, max_wait_time, check_interval, scene_name, attempt + 1
-        )
+        The first poll, status changes and final states are always printed;
+        unchanged in-progress statuses only every POLL_LOG_EVERY_N polls.
 
+        Args:
+            poll_count: Number of earlier in-progress polls
+            status: Status returned by this poll
+            last_status: Status returned by the previous poll
 
-class VideoGenerationTask:
-    """Wrapper for video generation task with proper thread management."""
+        Returns:
+            True if the poll result should be printed
+        """
+        return (
+            poll_count == 0
+            or status != last_status
+            or status in ("Succeed", "Failed")
+            or poll_count % VideoDefaults.POLL_LOG_EVERY_N == 0
+        )
 
-    def __init__(
-        self,
-        client,  # Can be any BaseVideoClient (VideoGenerationClient)
-        image_path: str,
-        prompt: str,
-        output_dir: str,
-        scene_name: str,
-        api_key: str,
-        scene_data: Dict[str, Any] = None,
-        **kwargs,
-    ):
-        self.client = client
-        self.image_path = image_path
-        self.prompt = prompt
-        self.output_dir = output_dir
-        self.scene_name = scene_name
-        self.api_key = api_key  # Store the API key used for this task
-        self.scene_data = scene_data  # Store scene data for audio enhancement
-        self.kwargs = kwargs
-        self.request_id = None
-        self.success = False
-        self.completed = False
-        self.error = None
-        self.thread = None
-        self.retry_count = 0
+    @staticmethod
+    def _next_poll_sleep(poll_count: int, poll_interval: float, check_interval: float) -> Tuple[float, float]:
+        """
+        Compute the wait before the next status poll.
 
-    def start(self):
-        """Start the video generation task."""
-        self.thread = threading.Thread(target=self._run, daemon=False)
-        self.thread.start()
-        return self.thread
+        Polls quickly at first since short videos finish early, then backs off
+        with jitter so parallel scenes do not poll in lockstep.
 
-    def _run(self):
-        """Run the video generation task with retry logic."""
-        self._run_with_retry()
+        Args:
+            poll_count: Number of polls made so far (1-based)
+            poll_interval: Current backoff interval
+            check_interval: Configured base polling interval
 
-    def _run_with_retry(self, attempt: int = 1):
-        """Run the video generation task with retry logic."""
-        # Show full key for debugging if environment variable is set
-        import os
-        show_full_key = os.getenv("YKGEN_DEBUG_KEYS", "false").lower() == "true"
-        
-        if show_full_key:
-            key_display = self.api_key if self.api_key else "unknown"
+        Returns:
+            Tuple of (seconds to sleep, next backoff interval)
+        """
+        if poll_count <= VideoDefaults.FAST_POLL_COUNT:
+            sleep_time = min(check_interval, VideoDefaults.FAST_POLL_INTERVAL_SECONDS)
         else:
-            key_display = f"*{self.api_key[-8:]}" if self.api_key else "unknown"
-        
-        try:
-            if attempt > 1:
-                print_info(f"🔄 Retrying {self.scene_name} generation (attempt {attempt}/{VideoDefaults.MAX_RETRY_ATTEMPTS}) with Key {key_display}")
-            else:
+            sleep_time = poll_interval
+            poll_interval = min(
+                poll_interval * VideoDefaults.POLL_BACKOFF_FACTOR,
+                VideoDefaults.POLL_MAX_INTERVAL_SECONDS,
+            )
+        sleep_time += random.uniform(0, VideoDefaults.POLL_JITTER_FRACTION * sleep_time)
+        return sleep_time, poll_interval
+
+    def _is_retryable_failure(self, reason: str) -> bool:
+        """Check if a failure reason indicates a retryable error."""
+        return bool(_RETRYABLE_FAILURE_RE.search(reason))
+
+    # Async API: a single event loop thread can drive many scenes at once,
+    # sharing one httpx.AsyncClient (see run_video_tasks_async).
+
+    async def submit_video_generation_async(
+        self,
+        http_client: "httpx.AsyncClient",
+        image_path: str,
+        prompt: str,
+        model: str = "Wan-AI/Wan2.1-I2V-14B-720P-Turbo",
+        image_size: str = "1280x720",
+        negative_prompt: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> Optional[str]:
+        """
+        Submit a video generation request without blocking the event loop.
+
+        Args:
+            http_client: Shared async HTTP client
+            image_path: Path to the input image
+            prompt: Text prompt for video generation
+            model: Model to use for generation
+            image_size: Output video size
+            negative_prompt: Negative prompt (optional)
+            seed: Random seed (optional)
+
+        Returns:
+            Request ID if successful, None otherwise
+        """
+        import httpx
+
+        url = f"{self.base_url}/video/submit"
+
+        try:
+            if self.upload_mode == "multipart":
+                # Reading the image is blocking work
+                image_bytes = await asyncio.to_thread(Path(image_path).read_bytes)
+                response = await http_client.post(
+                    url,
+                    data=self._build_multipart_fields(prompt, model, image_size, negative_prompt, seed),
+                    files={"image": (os.path.basename(image_path), image_bytes, "image/png")},
+                    headers=self._multipart_headers(),
+                )
+                if response.status_code in VideoDefaults.MULTIPART_REJECTED_STATUS_CODES:
+                    print_warning(
+                        f"Multipart upload rejected (HTTP {response.status_code}), falling back to base64"
+                    )
+                    self.upload_mode = "base64"
+            if self.upload_mode != "multipart":
+                # Reading and encoding the image is blocking work
+                image_base64 = await asyncio.to_thread(self._encode_image_to_base64, image_path)
+                payload = self._build_submit_payload(image_base64, prompt, model, image_size, negative_prompt, seed)
+                response = await http_client.post(url, content=_dumps_json(payload), headers=self.headers)
+            response.raise_for_status()
+            request_id = response.json().get("requestId")
+            status_update(
+                f"✅ Video generation submitted (Key: {self._key_display}, Request ID: {request_id})", "green"
+            )
+            return request_id
+
+        except httpx.HTTPError as e:
+            print_warning(f"Error submitting video generation: {e}")
+            if isinstance(e, httpx.HTTPStatusError):
+                print_warning(f"Response: {e.response.text}")
+            return None
+
+    async def check_video_status_async(
+        self, http_client: "httpx.AsyncClient", request_id: str
+    ) -> Dict[str, Any]:
+        """
+        Check the status of a video generation request, retrying server errors.
+
+        Args:
+            http_client: Shared async HTTP client
+            request_id: The request ID returned by the submission
+
+        Returns:
+            Status response dictionary; a failed check is reported as a
+            "Failed" status with the error as reason
+        """
+        try:
+            return await self._check_video_status_async(http_client, request_id)
+        except VideoStatusFailure as e:
+            return {"status": "Failed", "reason": e.reason}
+
+    async def _check_video_status_async(
+        self, http_client: "httpx.AsyncClient", request_id: str
+    ) -> Dict[str, Any]:
+        """
+        Check the status of a video generation request, retrying server errors.
+
+        Args:
+            http_client: Shared async HTTP client
+            request_id: The request ID returned by the submission
+
+        Returns:
+            Status response dictionary
+
+        Raises:
+            VideoStatusFailure: If the check failed; retryable is set when
+                only transient server or connection errors were seen
+        """
+        url = f"{self.base_url}/video/status"
+        body = _dumps_json({"requestId": request_id})
+
+        try:
+            return await _post_status_async(http_client, url, body, self.headers)
+        except RetryExhaustedError as e:
+            print_warning(
+                f"Max retries ({VideoDefaults.MAX_RETRY_ATTEMPTS}) reached for video status check: {e.last_error}"
+            )
+            raise VideoStatusFailure(str(e.last_error), retryable=True) from e.last_error
+
+    async def wait_and_download_video_async(
+        self,
+        http_client: "httpx.AsyncClient",
+        request_id: str,
+        output_path: str,
+        max_wait_time: int = 600,
+        check_interval: int = 5,
+        scene_name: str = None,
+    ):
+        """
+        Wait for video generation to complete and download the result once.
+
+        Args:
+            http_client: Shared async HTTP client
+            request_id: The request ID to monitor
+            output_path: Path where to save the video
+            max_wait_time: Maximum time to wait in seconds
+            check_interval: Interval between status checks in seconds
+            scene_name: Optional scene name for better logging
+
+        Returns:
+            None if the video was downloaded, the reason string if the attempt
+            may be retried, or False if it failed permanently
+        """
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        poll_count = 0
+        poll_interval = check_interval
+        last_status = None
+
+        while loop.time() - start_time < max_wait_time:
+            try:
+                status_response = await self._check_video_status_async(http_client, request_id)
+            except VideoStatusFailure as e:
+                return e.reason if e.retryable else False
+            status = status_response.get("status")
+
+            if self._should_log_poll(poll_count, status, last_status):
+                elapsed_time = int(loop.time() - start_time)
+                status_update(f"📊 {scene_name or 'Video'} status: {status} (elapsed: {elapsed_time}s)", "cyan")
+            last_status = status
+
+            if status == "Succeed":
+                videos = status_response.get("results", {}).get("videos", [])
+                if not (videos and videos[0].get("url")):
+                    print_warning("No video URL in response")
+                    return "No video URL in response"
+
+                status_update(f"Downloading video...", "bright_cyan")
+                try:
+                    # The video URL is not an API endpoint, so no auth header is sent
+                    total_bytes = 0
+                    async with http_client.stream(
+                        "GET", videos[0]["url"],
+                        timeout=httpx.Timeout(
+                            VideoDefaults.DOWNLOAD_READ_TIMEOUT_SECONDS,
+                            connect=VideoDefaults.DOWNLOAD_CONNECT_TIMEOUT_SECONDS,
+                        ),
+                    ) as video_response:
+                        video_response.raise_for_status()
+                        # File I/O runs in a worker thread so a slow disk does
+                        # not stall the other downloads on the event loop
+                        f = await asyncio.to_thread(open, output_path, "wb")
+                        try:
+                            async for chunk in video_response.aiter_bytes(VideoDefaults.DOWNLOAD_CHUNK_SIZE):
+                                await asyncio.to_thread(f.write, chunk)
+                                total_bytes += len(chunk)
+                        finally:
+                            await asyncio.to_thread(f.close)
+
+                    file_size = total_bytes / (1024 * 1024)  # MB
+                    print_success(f"Video downloaded successfully: {output_path} ({file_size:.1f} MB)")
+                    return None
+
+                except httpx.HTTPError as e:
+                    print_warning(f"Error downloading video: {e}")
+                    return str(e)
+
+            elif status == "Failed":
+                reason = status_response.get("reason", "Unknown error")
+                print_warning(f"Video generation failed: {reason}")
+                return reason if self._is_retryable_failure(reason) else False
+
+            # Still in progress, wait before checking again
+            poll_count += 1
+            sleep_time, poll_interval = self._next_poll_sleep(poll_count, poll_interval, check_interval)
+            remaining = max_wait_time - (loop.time() - start_time)
+            await asyncio.sleep(max(0, min(sleep_time, remaining)))
+
+        print_warning(f"Timeout waiting for video generation after {max_wait_time} seconds")
+        return "Timeout"
+
+
+class _RetryableStatusError(Exception):
+    """Transient server or connection error of one async status check."""
+
+
+def _report_status_retry(attempt: int, error: Exception, delay: float) -> None:
+    """Report a failed async status check the way the sync path does."""
+    print_warning(f"Error checking video status (attempt {attempt}/{VideoDefaults.MAX_RETRY_ATTEMPTS}): {error}")
+    print_warning(f"Retrying in {delay:.1f} seconds...")
+
+
+@retry_with_backoff_async(
+    max_retries=VideoDefaults.MAX_RETRY_ATTEMPTS - 1,
+    delay=VideoDefaults.RETRY_DELAY_SECONDS,
+    exponential=VideoDefaults.RETRY_EXPONENTIAL_BACKOFF,
+    exceptions=(_RetryableStatusError,),
+    on_retry=_report_status_retry,
+)
+async def _post_status_async(
+    http_client: "httpx.AsyncClient", url: str, body: bytes, headers: Dict[str, str]
+) -> Dict[str, Any]:
+    """
+    Post one async status check, retrying transient errors with backoff.
+
+    Args:
+        http_client: Shared async HTTP client
+        url: Status endpoint URL
+        body: Encoded status request
+        headers: API headers
+
+    Returns:
+        Status response dictionary
+
+    Raises:
+        VideoStatusFailure: On a non-retryable error
+        RetryExhaustedError: If transient errors persisted through all attempts
+    """
+    import httpx
+
+    try:
+        response = await http_client.post(url, content=body, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    except httpx.HTTPError as e:
+        is_retryable = (
+            (isinstance(e, httpx.HTTPStatusError) and e.response.status_code in [502, 503, 504]) or
+            isinstance(e, httpx.TransportError)
+        )
+        if is_retryable:
+            raise _RetryableStatusError(str(e)) from e
+        print_warning(f"Non-retryable error checking video status: {e}")
+        raise VideoStatusFailure(str(e), retryable=False) from e
+
+
+# Signalled whenever a video task finishes, so waiters need not poll
+_TASK_COMPLETION = threading.Condition()
+
+
+def _notify_task_completed() -> None:
+    """Wake up threads waiting for video tasks to complete."""
+    with _TASK_COMPLETION:
+        _TASK_COMPLETION.notify_all()
+
+
+class VideoGenerationTask:
+    """Wrapper for video generation task with proper thread management."""
+
+    def __init__(
+        self,
+        client,  # Can be any BaseVideoClient (VideoGenerationClient)
+        image_path: str,
+        prompt: str,
+        output_dir: str,
+        scene_name: str,
+        api_key: str,
+        scene_data: Dict[str, Any] = None,
+        **kwargs,
+    ):
+        self.client = client
+        self.image_path = image_path
+        self.prompt = prompt
+        self.output_dir = output_dir
+        self.scene_name = scene_name
+        self.api_key = api_key  # Store the API key used for this task
+        self._key_display = _format_key_display(api_key)
+        self.scene_data = scene_data  # Store scene data for audio enhancement
+        self.kwargs = kwargs
+        self.request_id = None
+        self.success = False
+        self.completed = False
+        self.error = None
+        self.future = None
+        self.retry_count = 0
+
+    def start(self, executor: Optional[Executor] = None) -> Future:
+        """
+        Start the video generation task.
+
+        Args:
+            executor: Executor to run the task on; a dedicated worker thread
+                is used if not given
+
+        Returns:
+            Future for the running task
+        """
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vidgen")
+            self.future = executor.submit(self._run)
+            executor.shutdown(wait=False)
+        else:
+            self.future = executor.submit(self._run)
+        return self.future
+
+    def _run(self):
+        """Run the video generation task with retry logic."""
+        try:
+            self._run_with_retry()
+        finally:
+            _notify_task_completed()
+
+    def _run_with_retry(self, attempt: int = 1):
+        """Run the video generation task with retry logic."""
+        key_display = self._key_display
+        
+        try:
+            if attempt > 1:
+                print_info(f"🔄 Retrying {self.scene_name} generation (attempt {attempt}/{VideoDefaults.MAX_RETRY_ATTEMPTS}) with Key {key_display}")
+            else:
                 print_info(f"🚀 Starting {self.scene_name} generation with Key {key_display}")
             
             self.request_id = self.client.submit_video_generation(
@@ -436,11 +1173,7 @@ class VideoGenerationTask:
 
     def _is_retryable_error(self, error: str) -> bool:
         """Check if an error is retryable."""
-        retryable_keywords = [
-            "502", "503", "504", "Bad Gateway", "Service Unavailable", 
-            "Gateway Timeout", "Connection", "Network", "Timeout", "RequestException"
-        ]
-        return any(keyword.lower() in error.lower() for keyword in retryable_keywords)
+        return bool(_RETRYABLE_ERROR_RE.search(error))
 
     def _handle_retry(self, attempt: int, error_reason: str):
         """Handle retry logic for failed tasks."""
@@ -459,14 +1192,111 @@ class VideoGenerationTask:
         # Retry the task
         self._run_with_retry(attempt + 1)
 
+    async def run_async(self, http_client: "httpx.AsyncClient") -> bool:
+        """
+        Run the video generation task on the event loop with retry logic.
+
+        Requires a client with the async API (VideoGenerationClient).
+
+        Args:
+            http_client: Shared async HTTP client
+
+        Returns:
+            True if the video was generated and downloaded
+        """
+        output_path = os.path.join(self.output_dir, f"{self.scene_name}.mp4")
+        try:
+            for attempt in range(1, VideoDefaults.MAX_RETRY_ATTEMPTS + 1):
+                self.retry_count = attempt - 1
+                if attempt > 1:
+                    print_info(f"🔄 Retrying {self.scene_name} generation (attempt {attempt}/{VideoDefaults.MAX_RETRY_ATTEMPTS})")
+                else:
+                    print_info(f"🚀 Starting {self.scene_name} generation")
+
+                self.request_id = await self.client.submit_video_generation_async(
+                    http_client, self.image_path, self.prompt, **self.kwargs
+                )
+                if not self.request_id:
+                    self.error = "Failed to submit video generation request"
+                else:
+                    error_reason = await self.client.wait_and_download_video_async(
+                        http_client, self.request_id, output_path, scene_name=self.scene_name
+                    )
+                    if error_reason is None:
+                        self.success = True
+                        self.error = None
+                        print_success(f"✅ {self.scene_name} completed successfully")
+                        return True
+                    self.error = f"Download failed for Request ID: {self.request_id}"
+                    if error_reason is False:
+                        break
+
+                if attempt < VideoDefaults.MAX_RETRY_ATTEMPTS:
+                    delay = VideoGenerationClient._retry_delay(attempt)
+                    print_warning(f"🔄 Will retry {self.scene_name} in {delay} seconds... (Reason: {self.error})")
+                    await asyncio.sleep(delay)
+
+            print_warning(f"❌ {self.scene_name} failed: {self.error}")
+            return False
+        except Exception as e:
+            self.error = str(e)
+            print_warning(f"❌ {self.scene_name} error: {str(e)}")
+            return False
+        finally:
+            self.completed = True
+            _notify_task_completed()
+
     def is_alive(self):
-        """Check if the thread is still running."""
-        return self.thread and self.thread.is_alive()
+        """Check if the task is still queued or running."""
+        return self.future is not None and not self.future.done()
 
     def join(self, timeout=None):
-        """Wait for the thread to complete."""
-        if self.thread:
-            self.thread.join(timeout)
+        """Wait for the task to complete."""
+        if self.future:
+            try:
+                self.future.result(timeout=timeout)
+            except TimeoutError:
+                pass
+
+
+async def run_video_tasks_async(
+    tasks: List[VideoGenerationTask],
+    max_concurrency: Optional[int] = None,
+) -> bool:
+    """
+    Run unstarted video tasks concurrently on the current event loop.
+
+    All tasks share one pooled httpx.AsyncClient, so polling many scenes
+    needs no thread per scene. Create the tasks with
+    generate_videos_from_images(..., start=False).
+
+    Args:
+        tasks: Video generation tasks that have not been started
+        max_concurrency: Maximum number of tasks in flight
+            (defaults to config.VIDEO_MAX_WORKERS)
+
+    Returns:
+        True if all videos completed successfully, False otherwise
+    """
+    import httpx
+
+    semaphore = asyncio.Semaphore(max_concurrency or config.VIDEO_MAX_WORKERS)
+    limits = httpx.Limits(
+        max_connections=NetworkDefaults.POOL_MAXSIZE,
+        max_keepalive_connections=NetworkDefaults.POOL_CONNECTIONS,
+    )
+    timeout = httpx.Timeout(
+        NetworkDefaults.REQUEST_TIMEOUT, connect=VideoDefaults.DOWNLOAD_CONNECT_TIMEOUT_SECONDS
+    )
+
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as http_client:
+        async def run(task: VideoGenerationTask) -> bool:
+            async with semaphore:
+                return await task.run_async(http_client)
+
+        results = await asyncio.gather(*(run(task) for task in tasks))
+
+    return all(results)
 
 
 def generate_videos_from_images(
@@ -474,6 +1304,8 @@ def generate_videos_from_images(
     scenes: List[Dict[str, Any]],
     output_dir: Optional[str] = None,
     video_provider: str = "siliconflow",
+    max_workers: Optional[int] = None,
+    start: bool = True,
 ) -> List[VideoGenerationTask]:
     """
     Generate videos from a list of images and scenes using the specified provider.
@@ -483,6 +1315,10 @@ def generate_videos_from_images(
         scenes: List of scene dictionaries with prompts
         output_dir: Directory to save videos (uses same as images if not specified)
         video_provider: Video provider to use ("siliconflow")
+        max_workers: Maximum number of videos generated concurrently
+            (defaults to config.VIDEO_MAX_WORKERS)
+        start: Whether to start the tasks on worker threads; pass False to
+            run them with run_video_tasks_async instead
 
     Returns:
         List of VideoGenerationTask objects
@@ -502,149 +1338,571 @@ def generate_videos_from_images(
             print_warning("No SiliconFlow API keys available for video generation")
             return []
 
-        # Display key allocation info for SiliconFlow
-        unique_keys = len(set(key_allocation.values()))
-        print_info(f"🔑 Using {unique_keys} SiliconFlow API key(s) for {video_count} video(s)")
-        
-        provider_info["name"] = "SiliconFlow"
-        
+        # Display key allocation info for SiliconFlow
+        unique_keys = len(set(key_allocation.values()))
+        print_info(f"🔑 Using {unique_keys} SiliconFlow API key(s) for {video_count} video(s)")
+        
+        provider_info["name"] = "SiliconFlow"
+        
+
+        
+    else:
+        print_warning(f"Unknown video provider: {video_provider}")
+        print_warning("Supported providers: siliconflow")
+        return []
+
+    # Use the same directory as images if not specified
+    if output_dir is None:
+        output_dir = str(Path(image_paths[0]).parent)
+
+    tasks = []
+    clients = {}  # One client (and connection pool) per API key
+
+    # Bounded worker pool: excess scenes queue instead of each getting a thread
+    executor = None
+    if start:
+        max_workers = max_workers or config.VIDEO_MAX_WORKERS
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(video_count, max_workers)), thread_name_prefix="vidgen"
+        )
+
+    for i, (image_path, scene) in enumerate(zip(image_paths, scenes)):
+        if not os.path.exists(image_path):
+            print(f"Image not found: {image_path}")
+            continue
+
+        # Get the allocated API key for this video
+        api_key = key_allocation.get(i)
+        if not api_key:
+            print(f"No API key allocated for video {i+1}")
+            continue
+
+        # Create the appropriate client based on provider
+        if video_provider.lower() == "siliconflow":
+            client = clients.get(api_key)
+            if client is None:
+                client = clients[api_key] = VideoGenerationClient(api_key)
+
+        else:
+            print(f"Unsupported video provider: {video_provider}")
+            continue
+
+        # SiliconFlow - conservative video prompts to avoid too much character movement
+        video_prompt, video_negative_prompt = build_conservative_video_prompt(scene)
+        scene_name = f"scene_{i+1:03d}"
+        
+        # Enhanced logging for video submission, written in one console call
+        key_short = api_key[-8:]
+        print_info("\n".join((
+            f"Submitting {scene_name} video generation with {provider_info['name']}:",
+            f"   └─ Using Key *{key_short}",
+            f"   └─ Original Scene Action: '{scene.get('action', 'No action')[:60]}...'",
+            f"   └─ Video Prompt: '{video_prompt}'",
+            f"   └─ Negative Prompt: '{video_negative_prompt}'",
+            "",
+        )))
+
+        # Create task parameters based on provider
+        task_kwargs = {
+            "negative_prompt": video_negative_prompt,
+            "scene_data": scene,
+        }
+        
+        # Add provider-specific parameters
+        # (Currently only SiliconFlow is supported)
+
+        task = VideoGenerationTask(
+            client=client,
+            image_path=image_path,
+            prompt=video_prompt,
+            output_dir=output_dir,
+            scene_name=scene_name,
+            api_key=api_key,
+            **task_kwargs
+        )
+
+        if start:
+            task.start(executor)
+        tasks.append(task)
+
+    # Queued tasks still run; the workers exit once all tasks are done
+    if executor is not None:
+        executor.shutdown(wait=False)
+    return tasks
+
+
+@functools.cache
+def _has_ffmpeg() -> bool:
+    """Check once whether ffmpeg is on PATH."""
+    return shutil.which("ffmpeg") is not None
+
+
+def _max_ffmpeg_jobs() -> int:
+    """Get the number of ffmpeg processes to run at once (half the CPUs)."""
+    return max(1, (os.cpu_count() or 1) // 2)
+
+
+def _map_ffmpeg_jobs(func: Callable[..., T], *iterables: List[Any], max_workers: Optional[int] = None) -> List[T]:
+    """
+    Run one ffmpeg or ffprobe job per item on a bounded thread pool.
+
+    The work happens in child processes, so threads are enough to keep
+    several of them busy at once.
+
+    Args:
+        func: Function starting one job; called with one item of each iterable
+        *iterables: Argument lists of equal length
+        max_workers: Number of concurrent jobs (default: half the CPUs)
+
+    Returns:
+        Results of func in input order
+    """
+    job_count = min(map(len, iterables), default=0)
+    if job_count <= 1:
+        return list(map(func, *iterables))
+    max_workers = min(max_workers or _max_ffmpeg_jobs(), job_count)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, *iterables))
+
+
+@functools.cache
+def _has_ffprobe() -> bool:
+    """Check once whether ffprobe is on PATH."""
+    return shutil.which("ffprobe") is not None
+
+
+def _ffprobe(media_path: str, *args: str) -> Optional[str]:
+    """
+    Run ffprobe on a media file.
+
+    Args:
+        media_path: Path to the media file
+        *args: ffprobe options selecting what to show
+
+    Returns:
+        Standard output of ffprobe, or None if it is not installed or failed
+    """
+    if not _has_ffprobe():
+        return None
+    try:
+        result = subprocess.run(["ffprobe", "-v", "error", *args, media_path], capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _cache_by_file(func: Callable[[str], T]) -> Callable[[str], T]:
+    """
+    Memoize a media probe per file version.
+
+    Results are keyed by the file's path, modification time and size, so a
+    file rewritten in place is probed again rather than served stale.
+
+    Args:
+        func: Probe taking the media path as its only argument
+
+    Returns:
+        Caching wrapper around the probe
+    """
+    @functools.lru_cache(maxsize=VideoDefaults.PROBE_CACHE_SIZE)
+    def cached(media_path: str, mtime_ns: int, size: int) -> T:
+        return func(media_path)
+
+    @functools.wraps(func)
+    def wrapper(media_path: str) -> T:
+        try:
+            stat = os.stat(media_path)
+        except OSError:
+            return func(media_path)
+        return cached(os.path.abspath(media_path), stat.st_mtime_ns, stat.st_size)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _open_media(media_path: str) -> Optional["av.container.InputContainer"]:
+    """
+    Open a media file with PyAV for probing.
+
+    Args:
+        media_path: Path to the media file
+
+    Returns:
+        Open input container, or None if PyAV is not installed or could
+        not open the file
+    """
+    if av is None:
+        return None
+    try:
+        return av.open(media_path)
+    except (av.error.FFmpegError, OSError, ValueError):
+        return None
+
+
+@_cache_by_file
+def _probe_streams(video_path: str) -> Optional[Tuple[Any, ...]]:
+    """
+    Probe the codec parameters of the first video stream of a file.
+
+    Args:
+        video_path: Path to the video file
+
+    Returns:
+        Tuple of (codec, width, height, pixel format, frame rate), or None
+        if the file could not be probed
+    """
+    container = _open_media(video_path)
+    if container is not None:
+        with container:
+            if not container.streams.video:
+                return None
+            stream = container.streams.video[0]
+            codec = stream.codec_context
+            # Frame rate is formatted like ffprobe's r_frame_rate so results
+            # from either backend compare equal
+            rate = stream.base_rate
+            frame_rate = f"{rate.numerator}/{rate.denominator}" if rate else None
+            return (codec.name, codec.width, codec.height, codec.pix_fmt, frame_rate)
+
+    output = _ffprobe(
+        video_path,
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "stream=codec_name,width,height,pix_fmt,r_frame_rate",
+        "-of",
+        "json",
+    )
+    try:
+        streams = json.loads(output).get("streams") if output else None
+    except ValueError:
+        return None
+    if not streams:
+        return None
+    stream = streams[0]
+    return tuple(stream.get(key) for key in ("codec_name", "width", "height", "pix_fmt", "r_frame_rate"))
+
+
+def _streams_compatible(video_paths: List[str]) -> bool:
+    """
+    Check whether videos can be concatenated with a stream copy.
+
+    Videos that could not be probed are assumed compatible so that the
+    stream copy is still attempted.
+
+    Args:
+        video_paths: Paths of the videos to combine
+
+    Returns:
+        False if the probed videos have differing codec parameters
+    """
+    existing_paths = [path for path in video_paths if os.path.exists(path)]
+    params = set(_map_ffmpeg_jobs(_probe_streams, existing_paths))
+    return None in params or len(params) <= 1
+
+
+@_cache_by_file
+def _get_duration(video_path: str) -> Optional[float]:
+    """
+    Get the duration of a media file.
+
+    Args:
+        video_path: Path to the media file
+
+    Returns:
+        Duration in seconds, or None if it could not be probed
+    """
+    container = _open_media(video_path)
+    if container is not None:
+        with container:
+            if container.duration is not None:
+                return float(container.duration) / av.time_base
+
+    output = _ffprobe(video_path, "-show_entries", "format=duration", "-of", "csv=p=0")
+    try:
+        return float(output) if output else None
+    except ValueError:
+        return None
+
+
+@_cache_by_file
+def _has_audio(video_path: str) -> bool:
+    """Check whether a media file has at least one audio stream."""
+    container = _open_media(video_path)
+    if container is not None:
+        with container:
+            return bool(container.streams.audio)
+
+    output = _ffprobe(video_path, "-select_streams", "a", "-show_entries", "stream=index", "-of", "csv=p=0")
+    return bool(output and output.strip())
+
+
+@_cache_by_file
+def _probe_audio_codec(audio_path: str) -> Optional[str]:
+    """
+    Get the codec of the first audio stream of a media file.
+
+    Args:
+        audio_path: Path to the media file
+
+    Returns:
+        Codec name such as "aac" or "mp3", or None if it could not be probed
+    """
+    container = _open_media(audio_path)
+    if container is not None:
+        with container:
+            streams = container.streams.audio
+            return streams[0].codec_context.name if streams else None
+
+    output = _ffprobe(audio_path, "-select_streams", "a:0", "-show_entries", "stream=codec_name", "-of", "csv=p=0")
+    return (output or "").strip() or None
+
+
+@_cache_by_file
+def _probe_frame_rates(video_path: str) -> Optional[Tuple[str, str]]:
+    """
+    Get the real and average frame rates of the first video stream.
+
+    Args:
+        video_path: Path to the video file
+
+    Returns:
+        (r_frame_rate, avg_frame_rate) as "num/den" strings, equal for a
+        constant frame rate stream, or None if they could not be probed
+    """
+    container = _open_media(video_path)
+    if container is not None:
+        with container:
+            if not container.streams.video:
+                return None
+            stream = container.streams.video[0]
+            rates = (stream.base_rate, stream.average_rate)
+            if None in rates:
+                return None
+            return tuple(f"{rate.numerator}/{rate.denominator}" for rate in rates)
+
+    output = _ffprobe(
+        video_path, "-select_streams", "v:0", "-show_entries", "stream=r_frame_rate,avg_frame_rate", "-of", "csv=p=0"
+    )
+    rates = tuple((output or "").strip().split(","))
+    return rates if len(rates) == 2 and "0/0" not in rates else None
+
+
+def _concat_list(video_paths: List[str]) -> str:
+    """
+    Build an ffmpeg concat demuxer list of the existing videos.
+
+    Paths are made absolute and single quotes in them are escaped. The
+    list is passed to ffmpeg on stdin (see _CONCAT_STDIN_INPUT), so no
+    temporary file is needed.
+
+    Args:
+        video_paths: Paths of the videos to list
+
+    Returns:
+        Concat list text
+    """
+    abs_paths = [path for path in map(os.path.abspath, video_paths) if os.path.exists(path)]
+    return "".join("file '" + path.replace("'", "'\\''") + "'\n" for path in abs_paths)
+
+
+def _run_ffmpeg(cmd: List[str], input: Optional[str] = None) -> subprocess.CompletedProcess:
+    """
+    Run an ffmpeg command, keeping only the tail of its stderr.
 
-        
-    else:
-        print_warning(f"Unknown video provider: {video_provider}")
-        print_warning("Supported providers: siliconflow")
-        return []
+    Long encodes write megabytes of progress output; only the last lines
+    are needed to report an error.
 
-    # Use the same directory as images if not specified
-    if output_dir is None:
-        output_dir = str(Path(image_paths[0]).parent)
+    Args:
+        cmd: Command to run
+        input: Optional text to write to ffmpeg's stdin
 
-    tasks = []
+    Returns:
+        Completed process whose stderr holds the last FFMPEG_STDERR_TAIL_LINES lines
+    """
+    tail = collections.deque(maxlen=VideoDefaults.FFMPEG_STDERR_TAIL_LINES)
+    with subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    ) as process:
+        if input is not None:
+            # Concat lists are far smaller than the pipe buffer
+            process.stdin.write(input)
+            process.stdin.close()
+        tail.extend(process.stderr)
+    return subprocess.CompletedProcess(cmd, process.returncode, stderr="".join(tail))
+
+
+@functools.cache
+def _select_video_encoder() -> Tuple[str, ...]:
+    """
+    Select the H.264 encoder for re-encoding, preferring hardware encoders.
 
-    for i, (image_path, scene) in enumerate(zip(image_paths, scenes)):
-        if not os.path.exists(image_path):
-            print(f"Image not found: {image_path}")
-            continue
+    A hardware encoder is only used if ffmpeg lists it and a tiny test
+    encode succeeds, since builds often include encoders whose device is
+    missing.
 
-        # Get the allocated API key for this video
-        api_key = key_allocation.get(i)
-        if not api_key:
-            print(f"No API key allocated for video {i+1}")
-            continue
+    Returns:
+        ffmpeg encoder arguments, starting with -c:v
+    """
+    if VideoDefaults.USE_HARDWARE_ENCODER and _has_ffmpeg():
+        try:
+            encoders = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True
+            ).stdout
+        except OSError:
+            encoders = ""
+        for encoder, encode_args in _HW_ENCODE_ARGS.items():
+            if encoder not in encoders:
+                continue
+            cmd = [
+                "ffmpeg",
+                "-hide_banner",
+                "-f",
+                "lavfi",
+                "-i",
+                "color=size=256x256:duration=0.1",
+                "-frames:v",
+                "1",
+                *encode_args,
+                "-f",
+                "null",
+                "-",
+            ]
+            if subprocess.run(cmd, capture_output=True).returncode == 0:
+                print(f"Using hardware video encoder: {encoder}")
+                return encode_args
+    return _LIBX264_ENCODE_ARGS
 
-        # Create the appropriate client based on provider
-        if video_provider.lower() == "siliconflow":
-            client = VideoGenerationClient(api_key)
 
-        else:
-            print(f"Unsupported video provider: {video_provider}")
-            continue
+def _compat_encode_args() -> Tuple[str, ...]:
+    """Get the re-encode arguments for the selected encoder."""
+    return (*_select_video_encoder(), "-movflags", "+faststart")
 
-        # Create video prompt from scene action and image prompt
-        scene_location = scene.get("location", "")
-        scene_time = scene.get("time", "")
-        scene_action = scene.get("action", "")
-        
-        # Build video prompt based on provider
-        if video_provider.lower() == "siliconflow":
-            # SiliconFlow - conservative video prompts to avoid too much character movement
-            video_prompt_parts = []
-            
-            # Start with static atmospheric elements only
-            if scene_location:
-                video_prompt_parts.append(f"static scene at {scene_location}")
-            if scene_time:
-                video_prompt_parts.append(f"during {scene_time}")
-                
-            # Minimize character movement - focus on environment instead of actions
-            if scene_action:
-                # Extract environmental elements and avoid character actions
-                action_lower = scene_action.lower()
-                
-                # Only add very minimal, environmental movements
-                if any(word in action_lower for word in ["wind", "breeze", "flowing", "rippling", "ripples"]):
-                    video_prompt_parts.append("gentle environmental movement")
-                elif any(word in action_lower for word in ["light", "glow", "shine", "sparkle", "glowing"]):
-                    video_prompt_parts.append("subtle lighting effects")
-                else:
-                    # For any other action, just add minimal movement
-                    video_prompt_parts.append("minimal movement")
-            
-            # Add very conservative atmospheric qualities that emphasize stillness
-            video_prompt_parts.extend([
-                "stable composition",
-                "minimal character movement", 
-                "environmental ambience",
-                "subtle lighting changes only",
-                "camera remains still"
-            ])
-            
-            video_prompt = ", ".join(video_prompt_parts)
-            
 
+def _libx264_encode_args(preset: str, crf: int) -> Tuple[str, ...]:
+    """
+    Get the libx264 encode arguments with a different preset and CRF.
 
-        scene_name = f"scene_{i+1:03d}"
+    Args:
+        preset: libx264 speed preset, e.g. "veryfast"
+        crf: Constant rate factor
 
-        # Enhanced logging for video submission
-        key_short = api_key[-8:]
-        print_info(f"Submitting {scene_name} video generation with {provider_info['name']}:")
-        print_info(f"   └─ Using Key *{key_short}")
-        print_info(f"   └─ Original Scene Action: '{scene.get('action', 'No action')[:60]}...'")
-        print_info(f"   └─ Video Prompt: '{video_prompt}'")
-        
-        # Create negative prompt based on provider
-        if video_provider.lower() == "siliconflow":
-            # SiliconFlow - conservative negative prompt for video to avoid excessive movement
-            base_negative = scene.get("image_prompt_negative", "")
-            video_negative_parts = [
-                "too much movement",
-                "excessive motion", 
-                "fast movement",
-                "rapid action",
-                "dramatic gestures",
-                "sudden changes",
-                "camera shake",
-                "blurry motion",
-                "distorted movement"
-            ]
-            
-            if base_negative:
-                video_negative_prompt = f"{base_negative}, {', '.join(video_negative_parts)}"
-            else:
-                video_negative_prompt = ", ".join(video_negative_parts)
-                
+    Returns:
+        ffmpeg encoder arguments, starting with -c:v
+    """
+    args = list(_LIBX264_ENCODE_ARGS)
+    args[args.index("-preset") + 1] = preset
+    args[args.index("-crf") + 1] = str(crf)
+    return tuple(args)
 
-        
-        print_info(f"   └─ Negative Prompt: '{video_negative_prompt}'")
-        print()
 
-        # Create task parameters based on provider
-        task_kwargs = {
-            "negative_prompt": video_negative_prompt,
-            "scene_data": scene,
-        }
-        
-        # Add provider-specific parameters
-        # (Currently only SiliconFlow is supported)
+def _reencode_clip(
+    video_path: str, output_path: str, threads: int, filters: str, audio_args: Tuple[str, ...]
+) -> bool:
+    """Re-encode one clip with the compatibility settings and the shared target format."""
+    # Intermediate clip: no +faststart, which would rewrite the file again
+    cmd = [
+        "ffmpeg",
+        "-i",
+        video_path,
+        "-vf",
+        filters,
+        *_select_video_encoder(),
+        *audio_args,
+        "-threads",
+        str(threads),
+        "-y",
+        output_path,
+    ]
+    return _run_ffmpeg(cmd).returncode == 0
+
+
+def _concat_reencoded_clips(
+    video_paths: List[str], output_path: str, max_workers: Optional[int] = None
+) -> bool:
+    """
+    Re-encode clips in parallel, then concatenate them with a stream copy.
 
-        task = VideoGenerationTask(
-            client=client,
-            image_path=image_path,
-            prompt=video_prompt,
-            output_dir=output_dir,
-            scene_name=scene_name,
-            api_key=api_key,
-            **task_kwargs
-        )
+    Each clip is encoded by its own ffmpeg process, which scales better
+    than one encoder working through all clips in sequence. Every clip is
+    scaled and resampled to the size and frame rate of the first one, so
+    the encoded clips can be joined without a parameter change mid-stream.
 
-        task.start()
-        tasks.append(task)
+    Args:
+        video_paths: List of paths to video files to combine
+        output_path: Path for the combined output video
+        max_workers: Number of concurrent encodes (default: half the CPUs)
 
-    return tasks
+    Returns:
+        True if successful, False otherwise (including when the first
+        clip could not be probed for the target format)
+    """
+    video_paths = [path for path in video_paths if os.path.exists(path)]
+    if not video_paths:
+        return False
+
+    target = _probe_streams(video_paths[0])
+    if target is None or None in target[1:3] or not target[4]:
+        return False
+    _, width, height, _, frame_rate = target
+    filters = f"scale={width}:{height},setsar=1,fps={frame_rate},format=yuv420p"
+    # Clips only keep their audio if every one has some, so all joined
+    # parts carry the same streams
+    if all(_map_ffmpeg_jobs(_has_audio, video_paths)):
+        audio_args = (
+            "-c:a", "aac",
+            "-b:a", VideoDefaults.AUDIO_BITRATE,
+            "-ar", str(VideoDefaults.AUDIO_SAMPLE_RATE),
+            "-ac", str(VideoDefaults.AUDIO_CHANNELS),
+        )
+    else:
+        audio_args = ("-an",)
+
+    max_workers = min(max_workers or _max_ffmpeg_jobs(), len(video_paths))
+    threads = [VideoDefaults.FFMPEG_THREADS_PER_JOB] * len(video_paths)
+
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    with tempfile.TemporaryDirectory(prefix=".combine-", dir=output_dir) as work_dir:
+        clip_paths = [os.path.join(work_dir, f"clip_{i:03d}.mp4") for i in range(len(video_paths))]
+
+        print(f"Re-encoding {len(video_paths)} clips with {max_workers} parallel encoders...")
+        _select_video_encoder()  # Probe once before the workers need it
+        results = _map_ffmpeg_jobs(
+            _reencode_clip,
+            video_paths,
+            clip_paths,
+            threads,
+            [filters] * len(video_paths),
+            [audio_args] * len(video_paths),
+            max_workers=max_workers,
+        )
+        if not all(results):
+            return False
+
+        cmd = [
+            "ffmpeg",
+            *_CONCAT_STDIN_INPUT,
+            "-c",
+            "copy",
+            "-movflags",
+            "+faststart",
+            "-y",
+            output_path,
+        ]
+        result = _run_ffmpeg(cmd, input=_concat_list(clip_paths))
+        return result.returncode == 0
 
 
 def combine_videos(
-    video_paths: List[str], output_path: str, transition_duration: float = 0.5
+    video_paths: List[str],
+    output_path: str,
+    transition_duration: float = 0.5,
+    audio_path: Optional[str] = None,
 ) -> bool:
     """
     Combine multiple videos into a single video with smooth transitions.
@@ -653,111 +1911,117 @@ def combine_videos(
         video_paths: List of paths to video files to combine
         output_path: Path for the combined output video
         transition_duration: Duration of crossfade transitions between videos
+        audio_path: Optional soundtrack to mux in the same pass; only the
+            multi-video stream copy path includes it
 
     Returns:
         True if successful, False otherwise
     """
+    return _combine_videos(video_paths, output_path, audio_path=audio_path)[0]
+
+
+def _combine_videos(
+    video_paths: List[str],
+    output_path: str,
+    audio_path: Optional[str] = None,
+) -> Tuple[bool, bool]:
+    """
+    Combine videos, reporting whether the soundtrack made it into the output.
+
+    Args:
+        video_paths: List of paths to video files to combine
+        output_path: Path for the combined output video
+        audio_path: Optional soundtrack to mux in the same pass
+
+    Returns:
+        Tuple of (success, whether audio_path was muxed into the output)
+    """
     if not video_paths:
         print("No videos to combine")
-        return False
+        return False, False
 
     if len(video_paths) == 1:
-        # If only one video, re-encode it for compatibility
+        # The clip is already H.264, so first try a stream copy (moving the
+        # moov atom for web playback) and only re-encode if that fails
         try:
             cmd = [
                 "ffmpeg",
                 "-i",
                 video_paths[0],
-                "-c:v",
-                "libx264",
-                "-pix_fmt",
-                "yuv420p",
-                "-profile:v",
-                "high",
-                "-level",
-                "4.0",
-                "-crf",
-                "23",
-                "-preset",
-                "medium",
+                "-c",
+                "copy",
                 "-movflags",
                 "+faststart",
                 "-y",
                 output_path,
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = _run_ffmpeg(cmd)
+            if result.returncode == 0:
+                print(f"Single video stream-copied to: {output_path}")
+                return True, False
+
+            cmd = ["ffmpeg", "-i", video_paths[0], *_compat_encode_args(), "-y", output_path]
+            result = _run_ffmpeg(cmd)
             if result.returncode == 0:
                 print(f"Single video re-encoded for compatibility: {output_path}")
-                return True
+                return True, False
             else:
                 # Fallback to simple copy
-                import shutil
-
-                shutil.copy2(video_paths[0], output_path)
+                shutil.copyfile(video_paths[0], output_path)
                 print(f"Single video copied to: {output_path}")
-                return True
+                return True, False
         except Exception:
-            import shutil
-
-            shutil.copy2(video_paths[0], output_path)
+            shutil.copyfile(video_paths[0], output_path)
             print(f"Single video copied to: {output_path}")
-            return True
+            return True, False
 
     print(f"Combining {len(video_paths)} videos into one...")
 
-    try:
-        # Check if ffmpeg is available
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if ffmpeg is available
+    if not _has_ffmpeg():
         print("❌ ffmpeg not found. Please install ffmpeg to combine videos.")
         print(
             "Install with: brew install ffmpeg (macOS) or apt-get install ffmpeg (Ubuntu)"
         )
-        return False
+        return False, False
 
     try:
-        # Create a temporary file list for ffmpeg
-        temp_list_file = output_path + ".txt"
+        # The file list is fed to ffmpeg on stdin
+        list_text = _concat_list(video_paths)
 
-        with open(temp_list_file, "w") as f:
-            for video_path in video_paths:
-                if os.path.exists(video_path):
-                    f.write(f"file '{os.path.abspath(video_path)}'\n")
-
-        # First try with re-encoding for better compatibility
-        cmd = [
-            "ffmpeg",
-            "-f",
-            "concat",
-            "-safe",
-            "0",
-            "-i",
-            temp_list_file,
-            "-c:v",
-            "libx264",
-            "-pix_fmt",
-            "yuv420p",
-            "-profile:v",
-            "high",
-            "-level",
-            "4.0",
-            "-crf",
-            "23",
-            "-preset",
-            "medium",
-            "-movflags",
-            "+faststart",  # Optimize for web playback
-            "-y",
-            output_path,
-        ]
+        # Clips produced by one model share codec parameters, so a stream
+        # copy without any pixel work is used whenever the inputs match
+        copied = False
+        if _streams_compatible(video_paths):
+            cmd = [
+                "ffmpeg",
+                "-fflags",
+                "+genpts",  # Regenerate timestamps across the joined clips
+                *_CONCAT_STDIN_INPUT,
+                *(_soundtrack_input(audio_path) if audio_path else ()),
+                "-c",
+                "copy",  # Copy streams without re-encoding for speed
+                *(["-map", "0:v", *_soundtrack_output_args(audio_path, 1)] if audio_path else ()),
+                "-avoid_negative_ts",
+                "make_zero",
+                "-movflags",
+                "+faststart",  # Optimize for web playback
+                "-y",
+                output_path,
+            ]
 
-        print(f"Running ffmpeg to combine videos with compatibility encoding...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+            print(f"Running ffmpeg to combine videos with stream copy...")
+            result = _run_ffmpeg(cmd, input=list_text)
+            copied = result.returncode == 0
+            if not copied:
+                print(f"⚠️ Stream copy failed: {result.stderr}")
+        else:
+            print("⚠️ Input videos differ in codec parameters, stream copy is not possible")
 
-        if result.returncode == 0:
+        if copied:
             print(
-                f"✅ Videos successfully combined with compatible encoding: {output_path}"
+                f"✅ Videos successfully combined with stream copy: {output_path}"
             )
 
             # Get output file size
@@ -765,35 +2029,23 @@ def combine_videos(
                 size_mb = os.path.getsize(output_path) / (1024 * 1024)
                 print(f"Combined video size: {size_mb:.1f} MB")
 
-            # Clean up temp file
-            if os.path.exists(temp_list_file):
-                os.remove(temp_list_file)
-
-            return True
+            return True, bool(audio_path)
         else:
-            print(f"⚠️ Compatible encoding failed: {result.stderr}")
-            print("🔄 Falling back to stream copy...")
-
-            # Fallback to stream copy (original method)
-            cmd_fallback = [
-                "ffmpeg",
-                "-f",
-                "concat",
-                "-safe",
-                "0",
-                "-i",
-                temp_list_file,
-                "-c",
-                "copy",  # Copy streams without re-encoding for speed
-                "-y",
-                output_path,
-            ]
+            print("🔄 Falling back to compatibility encoding...")
 
-            result = subprocess.run(cmd_fallback, capture_output=True, text=True)
+            # Fallback to re-encoding for inputs with differing parameters.
+            # Clips are encoded in parallel and joined with a stream copy;
+            # a single libx264 encode of the whole concat is the last resort.
+            if _concat_reencoded_clips(video_paths, output_path):
+                returncode = 0
+            else:
+                cmd_fallback = ["ffmpeg", *_CONCAT_STDIN_INPUT, *_COMPAT_ENCODE_ARGS, "-y", output_path]
+                result = _run_ffmpeg(cmd_fallback, input=list_text)
+                returncode = result.returncode
 
-            if result.returncode == 0:
+            if returncode == 0:
                 print(
-                    f"✅ Videos successfully combined with stream copy: {output_path}"
+                    f"✅ Videos successfully combined with compatible encoding: {output_path}"
                 )
 
                 # Get output file size
@@ -801,29 +2053,22 @@ def combine_videos(
                     size_mb = os.path.getsize(output_path) / (1024 * 1024)
                     print(f"Combined video size: {size_mb:.1f} MB")
 
-                # Clean up temp file
-                if os.path.exists(temp_list_file):
-                    os.remove(temp_list_file)
-
-                return True
+                return True, False
             else:
                 print(f"❌ ffmpeg failed with error: {result.stderr}")
-                return False
+                return False, False
 
     except Exception as e:
         print(f"❌ Error combining videos: {e}")
-        return False
-    finally:
-        # Clean up temp file if it exists
-        if os.path.exists(temp_list_file):
-            try:
-                os.remove(temp_list_file)
-            except Exception:
-                pass
+        return False, False
 
 
 def combine_videos_with_transitions(
-    video_paths: List[str], output_path: str, transition_duration: float = 1.0
+    video_paths: List[str],
+    output_path: str,
+    transition_duration: float = 1.0,
+    audio_path: Optional[str] = None,
+    preset: str = VideoDefaults.TRANSITION_PRESET,
 ) -> bool:
     """
     Combine videos with smooth crossfade transitions (requires re-encoding).
@@ -832,55 +2077,116 @@ def combine_videos_with_transitions(
         video_paths: List of paths to video files to combine
         output_path: Path for the combined output video
         transition_duration: Duration of crossfade transitions in seconds
+        audio_path: Optional soundtrack to mux in the same pass instead of
+            the clips' own audio
+        preset: libx264 preset used when no hardware encoder is available
 
     Returns:
         True if successful, False otherwise
     """
+    return _combine_videos_with_transitions(
+        video_paths, output_path, transition_duration, audio_path, preset
+    )[0]
+
+
+def _combine_videos_with_transitions(
+    video_paths: List[str],
+    output_path: str,
+    transition_duration: float = 1.0,
+    audio_path: Optional[str] = None,
+    preset: str = VideoDefaults.TRANSITION_PRESET,
+) -> Tuple[bool, bool]:
+    """
+    Combine videos with crossfades, reporting whether the soundtrack was muxed.
+
+    Fallbacks to plain concatenation keep the soundtrack where they can.
+
+    Args:
+        video_paths: List of paths to video files to combine
+        output_path: Path for the combined output video
+        transition_duration: Duration of crossfade transitions in seconds
+        audio_path: Optional soundtrack to mux in the same pass
+        preset: libx264 preset used when no hardware encoder is available
+
+    Returns:
+        Tuple of (success, whether audio_path was muxed into the output)
+    """
     if not video_paths:
         print("No videos to combine")
-        return False
+        return False, False
 
     if len(video_paths) == 1:
-        import shutil
-
-        shutil.copy2(video_paths[0], output_path)
-        return True
+        shutil.copyfile(video_paths[0], output_path)
+        return True, False
 
     print(f"Combining {len(video_paths)} videos with transitions...")
 
-    try:
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if not _has_ffmpeg():
         print("❌ ffmpeg not found. Please install ffmpeg to combine videos.")
-        return False
+        return False, False
 
     try:
         # Build complex ffmpeg filter for crossfade transitions
-        inputs = []
-        filters = []
+        video_paths = [path for path in video_paths if os.path.exists(path)]
+        if len(video_paths) < 2:
+            return _combine_videos(video_paths, output_path, audio_path=audio_path)
 
-        # Add all input files
-        for i, video_path in enumerate(video_paths):
-            if os.path.exists(video_path):
-                inputs.extend(["-i", video_path])
+        # The whole video is re-encoded for the blends, so libx264 uses a
+        # faster preset with a slightly lower CRF to hold quality
+        encode_args = _select_video_encoder()
+        if encode_args == _LIBX264_ENCODE_ARGS:
+            encode_args = _libx264_encode_args(preset, VideoDefaults.TRANSITION_CRF)
 
-        # Build filter chain for crossfades
-        if len(video_paths) >= 2:
-            # Start with first two videos
-            current_output = f"[0][1]xfade=transition=fade:duration={transition_duration}:offset=5[v01]"
-            filters.append(current_output)
-
-            # Add subsequent videos with crossfade
-            for i in range(2, len(video_paths)):
-                prev_label = f"v0{i-1}" if i == 2 else f"v{i-1}"
-                current_label = f"v{i}"
-                offset = 5 * i  # Approximate offset, adjust based on video length
+        inputs = []
+        for video_path in video_paths:
+            inputs.extend(["-i", video_path])
 
-                filter_str = f"[{prev_label}][{i}]xfade=transition=fade:duration={transition_duration}:offset={offset}[{current_label}]"
-                filters.append(filter_str)
+        # xfade needs inputs with one constant frame rate and time base.
+        # When the clips already match nothing is inserted, otherwise only
+        # the outliers are converted to the most common constant rate.
+        filters = []
+        labels = [str(i) for i in range(len(video_paths))]
+        rates = _map_ffmpeg_jobs(_probe_frame_rates, video_paths)
+        cfr_rates = collections.Counter(rate[0] for rate in rates if rate and rate[0] == rate[1])
+        if any(rates) and (len(cfr_rates) != 1 or len(set(rates)) != 1):
+            target_rate = cfr_rates.most_common(1)[0][0] if cfr_rates else str(VideoDefaults.TRANSITION_FPS)
+            for i, rate in enumerate(rates):
+                fps_filter = "" if rate == (target_rate, target_rate) else f"fps=fps={target_rate},"
+                filters.append(f"[{i}:v]{fps_filter}settb=AVTB[n{i}]")
+                labels[i] = f"n{i}"
+
+        # Each crossfade starts transition_duration before the end of the
+        # video joined so far: offset_i = sum(durations[:i]) - i * duration
+        durations = _map_ffmpeg_jobs(_get_duration, video_paths[:-1])
+        elapsed = 0.0
+        prev_label = labels[0]
+        for i in range(1, len(video_paths)):
+            clip_duration = durations[i - 1]
+            if clip_duration is None:
+                clip_duration = VideoDefaults.ASSUMED_CLIP_DURATION_SECONDS
+            elapsed += clip_duration
+            offset = max(0.0, elapsed - transition_duration * i)
+            filters.append(
+                f"[{prev_label}][{labels[i]}]xfade=transition=fade:duration={transition_duration}:offset={offset:.3f}[v{i}]"
+            )
+            prev_label = f"v{i}"
+
+        final_output = prev_label
+
+        # Crossfade the audio in the same pass when every clip has audio,
+        # so it does not need to be muxed in by a second encode
+        audio_args = []
+        if audio_path:
+            inputs.extend(_soundtrack_input(audio_path))
+            audio_args = _soundtrack_output_args(audio_path, len(video_paths))
+        elif all(_map_ffmpeg_jobs(_has_audio, video_paths)):
+            prev_label = "0:a"
+            for i in range(1, len(video_paths)):
+                filters.append(f"[{prev_label}][{i}:a]acrossfade=d={transition_duration}[a{i}]")
+                prev_label = f"a{i}"
+            audio_args = ["-map", f"[{prev_label}]", "-c:a", "aac", "-b:a", VideoDefaults.AUDIO_BITRATE]
 
         filter_complex = ";".join(filters)
-        final_output = f"v{len(video_paths)-1}" if len(video_paths) > 2 else "v01"
 
         cmd = [
             "ffmpeg",
@@ -889,41 +2195,40 @@ def combine_videos_with_transitions(
             filter_complex,
             "-map",
             f"[{final_output}]",
-            "-c:v",
-            "libx264",
-            "-crf",
-            "23",
-            "-preset",
-            "medium",
+            *encode_args,
+            *audio_args,
+            "-movflags",
+            "+faststart",  # Optimize for web playback
             "-y",
             output_path,
         ]
 
         print("Running ffmpeg with transitions (this may take longer)...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = _run_ffmpeg(cmd)
 
         if result.returncode == 0:
             print(f"✅ Videos with transitions combined: {output_path}")
             if os.path.exists(output_path):
                 size_mb = os.path.getsize(output_path) / (1024 * 1024)
                 print(f"Combined video size: {size_mb:.1f} MB")
-            return True
+            return True, bool(audio_path)
         else:
             print(f"❌ ffmpeg failed: {result.stderr}")
             # Fallback to simple concatenation
             print("🔄 Falling back to simple concatenation...")
-            return combine_videos(video_paths, output_path)
+            return _combine_videos(video_paths, output_path, audio_path=audio_path)
 
     except Exception as e:
         print(f"❌ Error combining videos with transitions: {e}")
         # Fallback to simple concatenation
-        return combine_videos(video_paths, output_path)
+        return _combine_videos(video_paths, output_path, audio_path=audio_path)
 
 
 def combine_scene_videos(
     output_dir: str,
     use_transitions: bool = True,
     video_paths: Optional[List[str]] = None,
+    audio_path: Optional[str] = None,
 ) -> Optional[str]:
     """
     Find and combine all scene videos in a directory.
@@ -932,9 +2237,36 @@ def combine_scene_videos(
         output_dir: Directory containing scene videos
         use_transitions: Whether to use crossfade transitions
         video_paths: Optional list of specific video paths to combine
+        audio_path: Optional soundtrack, muxed in while combining
+
+    Returns:
+        Path to combined video if successful, None otherwise; with a
+        soundtrack this is combined_story_with_audio.mp4
+    """
+    return combine_scene_videos_with_audio(output_dir, use_transitions, video_paths, audio_path)[0]
+
+
+def combine_scene_videos_with_audio(
+    output_dir: str,
+    use_transitions: bool = True,
+    video_paths: Optional[List[str]] = None,
+    audio_path: Optional[str] = None,
+) -> Tuple[Optional[str], bool]:
+    """
+    Combine scene videos, reporting whether the soundtrack was added.
+
+    The video is written as combined_story_with_audio.mp4 when the
+    soundtrack is added and as combined_story.mp4 otherwise.
+
+    Args:
+        output_dir: Directory containing scene videos
+        use_transitions: Whether to use crossfade transitions
+        video_paths: Optional list of specific video paths to combine
+        audio_path: Optional soundtrack, muxed in while combining
 
     Returns:
-        Path to combined video if successful, None otherwise
+        Tuple of (path to the combined video or None, whether audio_path
+        is in that video)
     """
     output_path = Path(output_dir)
 
@@ -942,31 +2274,129 @@ def combine_scene_videos(
         # Use provided video paths
         scene_videos = [Path(p) for p in video_paths if os.path.exists(p)]
     else:
-        # Find all scene videos (both original and enhanced)
-        scene_videos = sorted(output_path.glob("scene_*_enhanced.mp4"))
-        if not scene_videos:
-            scene_videos = sorted(output_path.glob("scene_*.mp4"))
+        # Find all scene videos (both original and enhanced) in one
+        # directory pass, preferring the enhanced ones
+        enhanced_videos, base_videos = [], []
+        with os.scandir(output_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("scene_") and name.endswith(".mp4"):
+                    base_videos.append(entry.path)
+                    if name.endswith("_enhanced.mp4"):
+                        enhanced_videos.append(entry.path)
+        scene_videos = [Path(p) for p in sorted(enhanced_videos or base_videos)]
 
     if not scene_videos:
         print("No scene videos found to combine")
-        return None
+        return None, False
 
     video_paths_list = [str(video) for video in scene_videos]
     combined_path = output_path / "combined_story.mp4"
+    if audio_path and not os.path.exists(audio_path):
+        print(f"Audio file not found: {audio_path}")
+        audio_path = None
+    if audio_path:
+        combined_path = output_path / "combined_story_with_audio.mp4"
 
     print(f"Found {len(video_paths_list)} scene videos to combine:")
     for video in video_paths_list:
         print(f"  📹 {Path(video).name}")
 
-    # Choose combination method
+    # Choose combination method; the soundtrack is muxed in the same pass
+    # so the combined video is not rewritten a second time
     if use_transitions and len(video_paths_list) > 1:
-        success = combine_videos_with_transitions(video_paths_list, str(combined_path))
+        success, soundtrack_muxed = _combine_videos_with_transitions(
+            video_paths_list, str(combined_path), audio_path=audio_path
+        )
+    else:
+        success, soundtrack_muxed = _combine_videos(video_paths_list, str(combined_path), audio_path=audio_path)
+
+    if not success:
+        return None, False
+
+    if audio_path and not soundtrack_muxed:
+        # A fallback path combined the video without the soundtrack, keeping
+        # the clips' own audio at most; add the soundtrack in a second pass
+        video_only_path = output_path / "combined_story.mp4"
+        os.replace(combined_path, video_only_path)
+        if not add_audio_to_video(str(video_only_path), audio_path, str(combined_path)):
+            return str(video_only_path), False
+    return str(combined_path), bool(audio_path)
+
+
+def _soundtrack_input(audio_path: str) -> List[str]:
+    """Get the ffmpeg input arguments for a soundtrack."""
+    return ["-thread_queue_size", "1024", "-i", audio_path]
+
+
+def _soundtrack_output_args(audio_path: str, input_index: int) -> List[str]:
+    """
+    Get the ffmpeg output arguments that mux in a soundtrack input.
+
+    AAC and MP3 soundtracks are copied, others are encoded as AAC.
+
+    Args:
+        audio_path: Path to the soundtrack
+        input_index: Index of the soundtrack among the ffmpeg inputs
+
+    Returns:
+        Mapping, codec and -shortest arguments
+    """
+    if _probe_audio_codec(audio_path) in _MP4_COPYABLE_AUDIO_CODECS:
+        codec_args = ["-c:a", "copy"]
     else:
-        success = combine_videos(video_paths_list, str(combined_path))
+        codec_args = ["-c:a", "aac", "-b:a", VideoDefaults.AUDIO_BITRATE]
+    return ["-map", f"{input_index}:a:0", *codec_args, "-shortest"]
+
+
+def _audio_mux_commands(video_path: str, audio_path: str, output_path: str) -> List[List[str]]:
+    """
+    Build the ffmpeg commands that add an audio track to a video.
+
+    Args:
+        video_path: Path to the video file
+        audio_path: Path to the audio file
+        output_path: Path for the output video with audio
 
-    if success:
-        return str(combined_path)
-    return None
+    Returns:
+        Commands to try in order until one succeeds
+    """
+    # A larger packet queue per input keeps the demuxer threads from
+    # blocking on this copy-only mux
+    cmd = [
+        "ffmpeg",
+        "-thread_queue_size",
+        "1024",
+        "-i",
+        video_path,
+        "-thread_queue_size",
+        "1024",
+        "-i",
+        audio_path,
+        "-c:v",
+        "copy",  # Copy video stream without re-encoding
+        "-c:a",
+        "aac",  # Encode audio as AAC
+        "-b:a",
+        "192k",  # Audio bitrate
+        "-map",
+        "0:v:0",  # Map first video stream from first input
+        "-map",
+        "1:a:0",  # Map first audio stream from second input
+        "-shortest",  # Finish when shortest stream ends
+        "-movflags",
+        "+faststart",  # Final output: optimize for web playback
+        "-y",
+        output_path,
+    ]
+
+    # MP4 carries AAC and MP3 audio as they are, so those are copied
+    # instead of re-encoded; the AAC encode stays as the fallback
+    if _probe_audio_codec(audio_path) in _MP4_COPYABLE_AUDIO_CODECS:
+        audio_index = cmd.index("-c:a")
+        copy_cmd = [*cmd[:audio_index], "-c:a", "copy", *cmd[audio_index + 4:]]
+        return [copy_cmd, cmd]
+    return [cmd]
 
 
 def add_audio_to_video(
@@ -997,42 +2427,20 @@ def add_audio_to_video(
 
     print(f"🎵 Adding audio to video: {Path(video_path).name}")
 
-    try:
-        # Check if ffmpeg is available
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if ffmpeg is available
+    if not _has_ffmpeg():
         print("❌ ffmpeg not found. Please install ffmpeg to add audio to videos.")
         return False
 
     try:
-        # Build ffmpeg command
-        cmd = [
-            "ffmpeg",
-            "-i",
-            video_path,
-            "-i",
-            audio_path,
-            "-c:v",
-            "copy",  # Copy video stream without re-encoding
-            "-c:a",
-            "aac",  # Encode audio as AAC
-            "-b:a",
-            "192k",  # Audio bitrate
-            "-map",
-            "0:v:0",  # Map first video stream from first input
-            "-map",
-            "1:a:0",  # Map first audio stream from second input
-            "-shortest",  # Finish when shortest stream ends
-            "-y",
-            output_path,
-        ]
+        commands = _audio_mux_commands(video_path, audio_path, output_path)
 
         # Add subtitle burning if subtitle path is provided
         # NOTE: Subtitle burning is currently disabled as it may not be necessary
         # if subtitle_path and os.path.exists(subtitle_path):
         #     print(f"📝 Also burning in subtitles from: {Path(subtitle_path).name}")
         #     # Need to re-encode video to burn in subtitles
-        #     cmd = [
+        #     commands = [[
         #         "ffmpeg",
         #         "-i",
         #         video_path,
@@ -1057,10 +2465,15 @@ def add_audio_to_video(
         #         "-shortest",
         #         "-y",
         #         output_path,
-        #     ]
+        #     ]]
 
         print("Running ffmpeg to add audio...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        for i, cmd in enumerate(commands):
+            if i:
+                print("⚠️ Audio stream copy failed, re-encoding audio as AAC...")
+            result = _run_ffmpeg(cmd)
+            if result.returncode == 0:
+                break
 
         if result.returncode == 0:
             print(f"✅ Audio added successfully: {output_path}")
@@ -1169,15 +2582,16 @@ def _legacy_wait_for_all_videos(
     print(f"\n🎥 Waiting for {len(tasks)} videos to complete (max {max_wait_minutes} minutes)...")
 
     try:
-        while time.time() - start_time < max_wait_seconds:
-            completed = sum(1 for task in tasks if task.completed)
-            successful = sum(1 for task in tasks if task.completed and task.success)
-            
-            if completed == len(tasks):
-                print(f"\n✅ All video generation tasks completed!")
-                return successful == len(tasks)
-            
-            time.sleep(VideoDefaults.THREAD_CHECK_INTERVAL)
+        # Woken by each finishing task instead of rescanning on a timer
+        with _TASK_COMPLETION:
+            all_completed = _TASK_COMPLETION.wait_for(
+                lambda: all(task.completed for task in tasks),
+                timeout=max_wait_seconds - (time.time() - start_time),
+            )
+
+        if all_completed:
+            print(f"\n✅ All video generation tasks completed!")
+            return all(task.success for task in tasks)
         
         print(f"\n⏰ Timeout reached after {max_wait_minutes} minutes")
         return False
@@ -12,7 +12,7 @@ import time
 from typing import List, Optional, Dict, Any
 
 from ykgen.config.constants import VideoDefaults
-from ..utils import calculate_file_size_mb, format_duration
+from ..utils import batch_stat, file_size_mb, format_duration
 
 
 class VideoTaskMonitor:
@@ -94,16 +94,22 @@ class VideoResultProcessor:
         video_paths = []
         scene_data = []
         
-        for task in tasks:
-            if task.success:
-                video_path = os.path.join(task.output_dir, f"{task.scene_name}.mp4")
-                if os.path.exists(video_path):
-                    size_mb = calculate_file_size_mb(video_path)
-                    print(f"  ✅ {task.scene_name}.mp4 ({size_mb} MB)")
-                    video_paths.append(video_path)
-                    
-                    if hasattr(task, "scene_data"):
-                        scene_data.append(task.scene_data)
+        successful_tasks = [task for task in tasks if task.success]
+        candidate_paths = [
+            os.path.join(task.output_dir, f"{task.scene_name}.mp4") for task in successful_tasks
+        ]
+        # One stat per video serves both the existence check and the size
+        stats = batch_stat(candidate_paths)
+        
+        for task, video_path in zip(successful_tasks, candidate_paths):
+            stat_result = stats[video_path]
+            if stat_result is not None:
+                size_mb = file_size_mb(video_path, stat_result=stat_result)
+                print(f"  ✅ {task.scene_name}.mp4 ({size_mb:.1f} MB)")
+                video_paths.append(video_path)
+                
+                if hasattr(task, "scene_data"):
+                    scene_data.append(task.scene_data)
         
         return video_paths, scene_data
     
@@ -112,26 +118,22 @@ class VideoResultProcessor:
         if len(video_paths) <= 1:
             return video_paths[0] if video_paths else None
         
-        from .siliconflow_client import combine_scene_videos, combine_videos_with_audio
+        from .siliconflow_client import combine_scene_videos_with_audio
         
         print(f"\nCombining {len(video_paths)} videos into one...")
         output_dir = os.path.dirname(video_paths[0])
         
-        combined_path = combine_scene_videos(
-            output_dir, use_transitions=True, video_paths=video_paths
+        # The generated audio/song is muxed in while combining, if available
+        if not (audio_path and os.path.exists(audio_path)):
+            audio_path = None
+        combined_path, soundtrack_added = combine_scene_videos_with_audio(
+            output_dir, use_transitions=True, video_paths=video_paths, audio_path=audio_path
         )
         
         if combined_path:
             print(f"🎉 Combined video created: {combined_path}")
-            
-            # Add the generated audio/song to the combined video if available
-            if audio_path and os.path.exists(audio_path):
-                final_video_with_audio = combine_videos_with_audio(
-                    combined_path, audio_path, output_dir
-                )
-                if final_video_with_audio:
-                    print(f"🎵 Added soundtrack to final video")
-                    return final_video_with_audio
+            if soundtrack_added:
+                print(f"🎵 Added soundtrack to final video")
             
             return combined_path
         else: